@@ -18,95 +18,15 @@ Usage:
 import os
 import sys
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-class ProjectSetup:
-    """Complete project setup and initialization"""
-
-    def __init__(self):
-        """Initialize setup"""
-        self.project_root = Path(__file__).parent.parent
-        self.required_dirs = [
-            'data',
-            'src',
-            'notebooks',
-            'results/UTS',
-            'results/UAS/visualizations',
-            'docs',
-            'presentation'
-        ]
-
-        self.setup_log = []
-
-    def log(self, message, level='INFO'):
-        """Log setup progress"""
-        prefix = {
-            'INFO': '✓',
-            'WARN': '⚠',
-            'ERROR': '✗',
-            'STEP': '→'
-        }.get(level, '•')
-
-        log_message = f"{prefix} {message}"
-        print(log_message)
-        self.setup_log.append(log_message)
-
-    def create_directories(self):
-        """Create all required directories"""
-        self.log("Creating project directories...", 'STEP')
-
-        for dir_path in self.required_dirs:
-            full_path = self.project_root / dir_path
-            if not full_path.exists():
-                full_path.mkdir(parents=True, exist_ok=True)
-                self.log(f"Created: {dir_path}")
-            else:
-                self.log(f"Already exists: {dir_path}", 'WARN')
-
-        print()
-
-    def create_init_files(self):
-        """Create __init__.py files for Python packages"""
-        self.log("Creating __init__.py files...", 'STEP')
-
-        # Create __init__.py in src/
-        init_file = self.project_root / 'src' / '__init__.py'
-        if not init_file.exists():
-            init_file.write_text('"""PT. MediCare Indonesia - Transportation Optimization"""\n')
-            self.log("Created: src/__init__.py")
-        else:
-            self.log("Already exists: src/__init__.py", 'WARN')
-
-        print()
-
-    def generate_data_files(self):
-        """Generate all data files"""
-        self.log("Generating data files...", 'STEP')
-
-        try:
-            # Import and run data generator
-            sys.path.insert(0, str(self.project_root / 'src'))
-            from generate_data_files import DataGenerator
-
-            generator = DataGenerator()
-            generator.generate_all_files()
-
-            self.log("All data files generated successfully")
-        except Exception as e:
-            self.log(f"Error generating data files: {str(e)}", 'ERROR')
-            self.log("Please run generate_data_files.py manually", 'WARN')
-
-        print()
+# Static scaffold file contents written by create_scaffold_files()
+INIT_CONTENT = '"""PT. MediCare Indonesia - Transportation Optimization"""\n'
 
-    def create_gitignore(self):
-        """Create .gitignore if not exists"""
-        self.log("Checking .gitignore...", 'STEP')
-
-        gitignore_path = self.project_root / '.gitignore'
-
-        if not gitignore_path.exists():
-            gitignore_content = """# Python
+GITIGNORE_CONTENT = """# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -136,21 +56,8 @@ env/
 # OS
 Thumbs.db
 """
-            gitignore_path.write_text(gitignore_content)
-            self.log("Created: .gitignore")
-        else:
-            self.log("Already exists: .gitignore", 'WARN')
-
-        print()
-
-    def create_requirements_txt(self):
-        """Create requirements.txt if not exists"""
-        self.log("Checking requirements.txt...", 'STEP')
 
-        req_path = self.project_root / 'requirements.txt'
-
-        if not req_path.exists():
-            requirements = """# Transportation Optimization Project Dependencies
+REQUIREMENTS_CONTENT = """# Transportation Optimization Project Dependencies
 # Python 3.8+
 
 # Core Optimization
@@ -161,6 +68,11 @@ scipy>=1.10.0
 pandas>=1.5.0
 numpy>=1.23.0
 openpyxl>=3.1.0
+xlsxwriter>=3.0.0
+"""
+
+REQUIREMENTS_VIZ_CONTENT = """# Visualization & Notebook Stack (optional)
+# Install setelah requirements.txt
 
 # Visualization
 matplotlib>=3.6.0
@@ -173,75 +85,10 @@ notebook>=6.5.0
 ipykernel>=6.20.0
 
 # Additional
-xlsxwriter>=3.0.0
 tabulate>=0.9.0
 """
-            req_path.write_text(requirements)
-            self.log("Created: requirements.txt")
-        else:
-            self.log("Already exists: requirements.txt", 'WARN')
-
-        print()
-
-    def validate_setup(self):
-        """Validate that setup is complete"""
-        self.log("Validating setup...", 'STEP')
-
-        all_valid = True
-
-        # Check directories
-        for dir_path in self.required_dirs:
-            full_path = self.project_root / dir_path
-            if not full_path.exists():
-                self.log(f"Missing directory: {dir_path}", 'ERROR')
-                all_valid = False
-
-        # Check data files
-        data_files = [
-            'data/warehouse_capacity.csv',
-            'data/destination_demand.csv',
-            'data/transportation_cost.csv',
-            'data/input_data.xlsx'
-        ]
-
-        for file_path in data_files:
-            full_path = self.project_root / file_path
-            if not full_path.exists():
-                self.log(f"Missing data file: {file_path}", 'WARN')
-
-        # Check source files
-        src_files = [
-            'src/__init__.py',
-            'src/model_formulation.py',
-            'src/python_solver.py',
-            'src/visualization.py',
-            'src/sensitivity_analysis.py',
-            'src/excel_solver.py',
-            'src/generate_data_files.py'
-        ]
-
-        for file_path in src_files:
-            full_path = self.project_root / file_path
-            if not full_path.exists():
-                self.log(f"Missing source file: {file_path}", 'WARN')
-
-        print()
-
-        if all_valid:
-            self.log("Setup validation passed!", 'INFO')
-        else:
-            self.log("Some issues found - please check above", 'WARN')
-
-        return all_valid
 
-    def create_readme(self):
-        """Create a quick start README if not exists"""
-        self.log("Checking README...", 'STEP')
-
-        readme_path = self.project_root / 'QUICKSTART.md'
-
-        if not readme_path.exists():
-            quickstart = """# Quick Start Guide
+QUICKSTART_CONTENT = """# Quick Start Guide
 ## Transportation Optimization Project
 
 ### 1. Setup Environment
@@ -256,8 +103,11 @@ venv\\Scripts\\activate
 # Activate (Mac/Linux)
 source venv/bin/activate
 
-# Install dependencies
+# Install core dependencies
 pip install -r requirements.txt
+
+# Optional: notebook & visualization stack
+pip install -r requirements-viz.txt
 ```
 
 ### 2. Verify Data Files
@@ -298,11 +148,201 @@ After running all notebooks, compile your final report using the template in `do
 
 For detailed instructions, see `README.md`.
 """
-            readme_path.write_text(quickstart)
-            self.log("Created: QUICKSTART.md")
+
+
+class ProjectSetup:
+    """Complete project setup and initialization"""
+
+    def __init__(self):
+        """Initialize setup"""
+        self.project_root = Path(__file__).parent.parent
+        self.required_dirs = [
+            'data',
+            'src',
+            'notebooks',
+            'results/UTS',
+            'results/UAS/visualizations',
+            'docs',
+            'presentation'
+        ]
+
+        self.setup_log = []
+
+        # Cache of os.stat results so each path is stat'ed at most once
+        # across the whole setup (matters on network filesystems)
+        self._stat_cache = {}
+
+        # Setup steps may run from worker threads, so keep the log atomic
+        self._log_lock = threading.Lock()
+
+    def _stat(self, path):
+        """Return the cached os.stat result for path (None if missing)"""
+        path = Path(path)
+        try:
+            return self._stat_cache[path]
+        except KeyError:
+            try:
+                result = os.stat(path)
+            except FileNotFoundError:
+                result = None
+            self._stat_cache[path] = result
+            return result
+
+    def _path_exists(self, path):
+        """Cached replacement for Path.exists()"""
+        return self._stat(path) is not None
+
+    def log(self, message, level='INFO'):
+        """Log setup progress"""
+        prefix = {
+            'INFO': '✓',
+            'WARN': '⚠',
+            'ERROR': '✗',
+            'STEP': '→'
+        }.get(level, '•')
+
+        log_message = f"{prefix} {message}"
+        with self._log_lock:
+            print(log_message)
+            self.setup_log.append(log_message)
+
+    def create_directories(self):
+        """Create all required directories"""
+        self.log("Creating project directories...", 'STEP')
+
+        # The directories are independent, so overlap their mkdir latency
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(self._ensure_dir, self.required_dirs))
 
         print()
 
+    def _ensure_dir(self, dir_path):
+        """Create one required directory if it does not already exist
+
+        Attempts the mkdir directly and treats FileExistsError as "already
+        there" — no pre-stat needed.
+        """
+        full_path = self.project_root / dir_path
+        try:
+            full_path.mkdir(parents=True, exist_ok=False)
+        except FileExistsError:
+            self.log(f"Already exists: {dir_path}", 'WARN')
+        else:
+            self._stat_cache[full_path] = os.stat(full_path)
+            self.log(f"Created: {dir_path}")
+
+    def _write_new(self, path, content):
+        """Write content to path only if the file does not exist yet
+
+        Opens with mode 'x' so the existence check and the create are one
+        atomic syscall instead of stat-then-write.
+        """
+        try:
+            with open(path, 'x', encoding='utf-8') as f:
+                f.write(content)
+        except FileExistsError:
+            return False
+        self._stat_cache[Path(path)] = os.stat(path)
+        return True
+
+    def create_scaffold_files(self):
+        """Create all static scaffold files in one table-driven pass"""
+        self.log("Writing scaffold files...", 'STEP')
+
+        # Every scaffold file is a plain (path, content) pair, so one loop
+        # with _write_new covers them all — no per-file stat, no per-file
+        # method boilerplate
+        files_to_write = [
+            ('src/__init__.py', INIT_CONTENT),
+            ('.gitignore', GITIGNORE_CONTENT),
+            ('requirements.txt', REQUIREMENTS_CONTENT),
+            ('requirements-viz.txt', REQUIREMENTS_VIZ_CONTENT),
+            ('QUICKSTART.md', QUICKSTART_CONTENT),
+        ]
+
+        def _write(entry):
+            rel_path, content = entry
+            if self._write_new(self.project_root / rel_path, content):
+                self.log(f"Created: {rel_path}")
+            else:
+                self.log(f"Already exists: {rel_path}", 'WARN')
+
+        # Independent files: overlap their write latency
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(_write, files_to_write))
+
+        print()
+
+    def generate_data_files(self):
+        """Generate all data files"""
+        self.log("Generating data files...", 'STEP')
+
+        try:
+            # Import and run data generator
+            sys.path.insert(0, str(self.project_root / 'src'))
+            from generate_data_files import DataGenerator
+
+            generator = DataGenerator()
+            generator.generate_all_files()
+
+            self.log("All data files generated successfully")
+        except Exception as e:
+            self.log(f"Error generating data files: {str(e)}", 'ERROR')
+            self.log("Please run generate_data_files.py manually", 'WARN')
+
+        print()
+
+    def validate_setup(self):
+        """Validate that setup is complete"""
+        self.log("Validating setup...", 'STEP')
+
+        all_valid = True
+
+        # Check directories
+        for dir_path in self.required_dirs:
+            full_path = self.project_root / dir_path
+            if not self._path_exists(full_path):
+                self.log(f"Missing directory: {dir_path}", 'ERROR')
+                all_valid = False
+
+        # Check data files
+        data_files = [
+            'data/warehouse_capacity.csv',
+            'data/destination_demand.csv',
+            'data/transportation_cost.csv',
+            'data/input_data.xlsx'
+        ]
+
+        for file_path in data_files:
+            full_path = self.project_root / file_path
+            if not self._path_exists(full_path):
+                self.log(f"Missing data file: {file_path}", 'WARN')
+
+        # Check source files
+        src_files = [
+            'src/__init__.py',
+            'src/model_formulation.py',
+            'src/python_solver.py',
+            'src/visualization.py',
+            'src/sensitivity_analysis.py',
+            'src/excel_solver.py',
+            'src/generate_data_files.py'
+        ]
+
+        for file_path in src_files:
+            full_path = self.project_root / file_path
+            if not self._path_exists(full_path):
+                self.log(f"Missing source file: {file_path}", 'WARN')
+
+        print()
+
+        if all_valid:
+            self.log("Setup validation passed!", 'INFO')
+        else:
+            self.log("Some issues found - please check above", 'WARN')
+
+        return all_valid
+
     def display_summary(self):
         """Display setup summary"""
         print()
@@ -314,7 +354,7 @@ For detailed instructions, see `README.md`.
         print("Project Structure Created:")
         for dir_path in self.required_dirs:
             full_path = self.project_root / dir_path
-            status = "✓" if full_path.exists() else "✗"
+            status = "✓" if self._path_exists(full_path) else "✗"
             print(f"  {status} {dir_path}/")
 
         print()
@@ -328,7 +368,7 @@ For detailed instructions, see `README.md`.
 
         for filename in data_files:
             full_path = self.project_root / 'data' / filename
-            status = "✓" if full_path.exists() else "✗"
+            status = "✓" if self._path_exists(full_path) else "✗"
             print(f"  {status} data/{filename}")
 
         print()
@@ -359,11 +399,9 @@ For detailed instructions, see `README.md`.
 
         # Run setup steps
         self.create_directories()
-        self.create_init_files()
-        self.create_gitignore()
-        self.create_requirements_txt()
+
+        self.create_scaffold_files()
         self.generate_data_files()
-        self.create_readme()
         self.validate_setup()
 
         # Display summary
@@ -12,11 +12,12 @@ Note: This module prepares Excel files but actual solving
 must be done manually in Excel using the Solver add-in.
 """
 
-import pandas as pd
 import numpy as np
 from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.dimensions import ColumnDimension
 from model_formulation import TransportationData
 import os
 
@@ -35,26 +36,14 @@ class ExcelSolverHelper:
         self.workbook = None
         self.worksheet = None
 
-    def create_solver_workbook(self, filename='transportation_solver_template.xlsx'):
+    @staticmethod
+    def _register_styles(wb):
         """
-        Create Excel workbook formatted for Solver
+        Register the shared named styles once per workbook
 
-        Args:
-            filename: Output filename
+        Each cell then carries a single interned style reference instead of
+        rebuilding fill/font/alignment objects per assignment.
         """
-        print(f"Creating Excel Solver template: {filename}")
-
-        # Create workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Solver Model"
-
-        # Styles
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=11)
-        data_fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-        result_fill = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
-        result_font = Font(bold=True, size=12)
         border = Border(
             left=Side(style='thin'),
             right=Side(style='thin'),
@@ -62,176 +51,200 @@ class ExcelSolverHelper:
             bottom=Side(style='thin')
         )
 
-        # Title
-        ws['A1'] = "Transportation Problem - PT. MediCare Indonesia"
-        ws['A1'].font = Font(bold=True, size=14)
-        ws.merge_cells('A1:G1')
+        header = NamedStyle(name='hdr')
+        header.font = Font(bold=True, color="FFFFFF", size=11)
+        header.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        header.alignment = Alignment(horizontal='center')
 
-        # Section 1: Cost Matrix
-        row = 3
-        ws.cell(row, 1, "COST MATRIX (Rp thousands per unit)").font = Font(bold=True, size=12)
-        row += 1
-
-        # Headers
-        ws.cell(row, 1, "From \\ To").fill = header_fill
-        ws.cell(row, 1).font = header_font
-        for j, dest in enumerate(self.data.destinations, 2):
-            ws.cell(row, j, dest.replace('_', ' ')).fill = header_fill
-            ws.cell(row, j).font = header_font
-            ws.cell(row, j).alignment = Alignment(horizontal='center')
-
-        # Cost data
-        row += 1
-        cost_start_row = row
-        for i, warehouse in enumerate(self.data.warehouses):
-            ws.cell(row, 1, warehouse).fill = header_fill
-            ws.cell(row, 1).font = header_font
-
-            for j, dest in enumerate(self.data.destinations, 2):
-                cost = self.data.costs[(warehouse, dest)]
-                cell = ws.cell(row, j, cost)
-                cell.alignment = Alignment(horizontal='center')
-                cell.border = border
-            row += 1
-        cost_end_row = row - 1
+        cost_cell = NamedStyle(name='cost_cell')
+        cost_cell.alignment = Alignment(horizontal='center')
+        cost_cell.border = border
 
-        # Section 2: Supply and Demand
-        row += 1
-        supply_row_start = row
+        alloc_cell = NamedStyle(name='alloc_cell')
+        alloc_cell.fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
+        alloc_cell.alignment = Alignment(horizontal='center')
+        alloc_cell.border = border
 
-        # Supply
-        ws.cell(row, 1, "SUPPLY (Capacity)").font = Font(bold=True, size=12)
-        ws.cell(row, 4, "DEMAND (Requirements)").font = Font(bold=True, size=12)
-        row += 1
+        result_cell = NamedStyle(name='result_cell')
+        result_cell.fill = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
+        result_cell.alignment = Alignment(horizontal='center')
 
-        ws.cell(row, 1, "Warehouse").fill = header_fill
-        ws.cell(row, 1).font = header_font
-        ws.cell(row, 2, "Capacity").fill = header_fill
-        ws.cell(row, 2).font = header_font
+        for style in (header, cost_cell, alloc_cell, result_cell):
+            wb.add_named_style(style)
 
-        ws.cell(row, 4, "Destination").fill = header_fill
-        ws.cell(row, 4).font = header_font
-        ws.cell(row, 5, "Demand").fill = header_fill
-        ws.cell(row, 5).font = header_font
+    def create_solver_workbook(self, filename='transportation_solver_template.xlsx'):
+        """
+        Create Excel workbook formatted for Solver
 
-        row += 1
-        supply_data_start = row
+        Uses openpyxl write-only mode, so rows are streamed to disk and
+        memory stays constant in the size of the allocation matrix.
 
-        for warehouse in self.data.warehouses:
-            ws.cell(row, 1, warehouse)
-            ws.cell(row, 2, self.data.supply[warehouse]).alignment = Alignment(horizontal='center')
-            row += 1
-        supply_data_end = row - 1
-
-        # Demand (align with supply)
-        row = supply_data_start
-        demand_data_start = row
-        for dest in self.data.destinations:
-            ws.cell(row, 4, dest.replace('_', ' '))
-            ws.cell(row, 5, self.data.demand[dest]).alignment = Alignment(horizontal='center')
-            row += 1
-        demand_data_end = row - 1
+        Args:
+            filename: Output filename
+        """
+        print(f"Creating Excel Solver template: {filename}")
 
-        # Section 3: Decision Variables (Allocation Matrix)
-        row += 2
-        ws.cell(row, 1, "ALLOCATION MATRIX (Decision Variables)").font = Font(bold=True, size=12)
-        ws.cell(row, 8, "← Solver will change these cells").font = Font(italic=True, color="FF0000")
-        row += 1
-
-        # Headers
-        ws.cell(row, 1, "From \\ To").fill = header_fill
-        ws.cell(row, 1).font = header_font
-        for j, dest in enumerate(self.data.destinations, 2):
-            ws.cell(row, j, dest.replace('_', ' ')).fill = header_fill
-            ws.cell(row, j).font = header_font
-            ws.cell(row, j).alignment = Alignment(horizontal='center')
-        ws.cell(row, len(self.data.destinations) + 2, "Total Shipped").fill = header_fill
-        ws.cell(row, len(self.data.destinations) + 2).font = header_font
-
-        row += 1
-        allocation_start_row = row
-
-        # Allocation cells (initially 0)
-        for i, warehouse in enumerate(self.data.warehouses):
-            ws.cell(row, 1, warehouse).fill = header_fill
-            ws.cell(row, 1).font = header_font
-
-            for j, dest in enumerate(self.data.destinations, 2):
-                cell = ws.cell(row, j, 0)
-                cell.fill = data_fill
-                cell.alignment = Alignment(horizontal='center')
-                cell.border = border
-
-            # Total shipped (sum formula)
-            col = len(self.data.destinations) + 2
-            start_col = get_column_letter(2)
-            end_col = get_column_letter(len(self.data.destinations) + 1)
-            ws.cell(row, col, f"=SUM({start_col}{row}:{end_col}{row})")
-            ws.cell(row, col).fill = result_fill
-            ws.cell(row, col).alignment = Alignment(horizontal='center')
+        # Create workbook (write-only: rows are serialized as appended)
+        wb = Workbook(write_only=True)
+        self._register_styles(wb)
+        ws = wb.create_sheet("Solver Model")
 
-            row += 1
-        allocation_end_row = row - 1
+        warehouses = self.data.warehouses
+        destinations = self.data.destinations
+        n_dest = len(destinations)
+        dest_labels = [d.replace('_', ' ') for d in destinations]
 
-        # Total received row
-        ws.cell(row, 1, "Total Received").fill = header_fill
-        ws.cell(row, 1).font = header_font
+        # One base-26 conversion per column instead of one per formula
+        col_letters = [None] + [get_column_letter(i) for i in range(1, n_dest + 5)]
 
-        for j, dest in enumerate(self.data.destinations, 2):
-            col_letter = get_column_letter(j)
-            ws.cell(row, j, f"=SUM({col_letter}{allocation_start_row}:{col_letter}{allocation_end_row})")
-            ws.cell(row, j).fill = result_fill
-            ws.cell(row, j).alignment = Alignment(horizontal='center')
+        # Column widths must be declared before any row is streamed in
+        # write-only mode; one spanned entry covers all data columns
+        ws.column_dimensions['A'].width = 25
+        ws.column_dimensions['B'] = ColumnDimension(
+            ws, min=2, max=n_dest + 4, width=15, customWidth=True)
+
+        center = Alignment(horizontal='center')
+
+        def _cell(value=None, style=None, font=None, fill=None,
+                  number_format=None, alignment=None):
+            """Build one styled WriteOnlyCell"""
+            cell = WriteOnlyCell(ws, value=value)
+            if style:
+                cell.style = style
+            if font:
+                cell.font = font
+            if fill:
+                cell.fill = fill
+            if number_format:
+                cell.number_format = number_format
+            if alignment:
+                cell.alignment = alignment
+            return cell
+
+        row = 0
+
+        def _append(values=()):
+            """Append one row and return its 1-based index"""
+            nonlocal row
+            ws.append(values)
+            row += 1
+            return row
 
-        total_row = row
+        section_font = Font(bold=True, size=12)
 
-        # Section 4: Objective Function
-        row += 2
-        ws.cell(row, 1, "OBJECTIVE FUNCTION").font = Font(bold=True, size=12)
-        row += 1
+        # Title (plain cell in A1; no merge needed in a report-only sheet)
+        _append([_cell("Transportation Problem - PT. MediCare Indonesia",
+                       font=Font(bold=True, size=14))])
+        _append()
 
-        ws.cell(row, 1, "Total Transportation Cost:").font = Font(bold=True)
+        # Section 1: Cost Matrix
+        _append([_cell("COST MATRIX (Rp thousands per unit)", font=section_font)])
+        _append([_cell("From \\ To", style='hdr')] +
+                [_cell(label, style='hdr') for label in dest_labels])
+
+        cost_start_row = row + 1
+        cost_matrix = self.data.cost_matrix
+        for i, warehouse in enumerate(warehouses):
+            _append([_cell(warehouse, style='hdr')] +
+                    [_cell(int(cost), style='cost_cell')
+                     for cost in cost_matrix[i]])
+        cost_end_row = row
+
+        # Section 2: Supply and Demand (side by side)
+        _append()
+        _append([_cell("SUPPLY (Capacity)", font=section_font), None, None,
+                 _cell("DEMAND (Requirements)", font=section_font)])
+        _append([_cell("Warehouse", style='hdr'), _cell("Capacity", style='hdr'), None,
+                 _cell("Destination", style='hdr'), _cell("Demand", style='hdr')])
+
+        supply_data_start = row + 1
+        for idx in range(max(len(warehouses), n_dest)):
+            w = warehouses[idx] if idx < len(warehouses) else None
+            d = destinations[idx] if idx < n_dest else None
+            _append([
+                w,
+                _cell(self.data.supply[w], alignment=center) if w else None,
+                None,
+                d.replace('_', ' ') if d else None,
+                _cell(self.data.demand[d], alignment=center) if d else None
+            ])
+        supply_data_end = supply_data_start + len(warehouses) - 1
+        demand_data_start = supply_data_start
+        demand_data_end = supply_data_start + n_dest - 1
 
-        # SUMPRODUCT formula
-        cost_range = f"B{cost_start_row}:{get_column_letter(len(self.data.destinations)+1)}{cost_end_row}"
-        alloc_range = f"B{allocation_start_row}:{get_column_letter(len(self.data.destinations)+1)}{allocation_end_row}"
+        # Section 3: Decision Variables (Allocation Matrix)
+        _append()
+        _append()
+        _append([_cell("ALLOCATION MATRIX (Decision Variables)", font=section_font)] +
+                [None] * 6 +
+                [_cell("← Solver will change these cells",
+                       font=Font(italic=True, color="FF0000"))])
+        _append([_cell("From \\ To", style='hdr')] +
+                [_cell(label, style='hdr') for label in dest_labels] +
+                [_cell("Total Shipped", style='hdr')])
+
+        allocation_start_row = row + 1
+        start_col = col_letters[2]
+        end_col = col_letters[n_dest + 1]
+
+        # Allocation cells (initially 0) plus the row-total formula
+        for warehouse in warehouses:
+            next_row = row + 1
+            _append([_cell(warehouse, style='hdr')] +
+                    [_cell(0, style='alloc_cell') for _ in destinations] +
+                    [_cell(f"=SUM({start_col}{next_row}:{end_col}{next_row})",
+                           style='result_cell')])
+        allocation_end_row = row
 
-        ws.cell(row, 2, f"=SUMPRODUCT({cost_range},{alloc_range})")
-        ws.cell(row, 2).fill = PatternFill(start_color="92D050", end_color="92D050", fill_type="solid")
-        ws.cell(row, 2).font = Font(bold=True, size=14)
-        ws.cell(row, 2).number_format = '#,##0'
+        # Total received row
+        _append([_cell("Total Received", style='hdr')] +
+                [_cell(f"=SUM({col_letters[j]}{allocation_start_row}:"
+                       f"{col_letters[j]}{allocation_end_row})",
+                       style='result_cell')
+                 for j in range(2, n_dest + 2)])
+        total_row = row
 
-        ws.cell(row, 3, "Rp thousands").font = Font(italic=True)
+        # Section 4: Objective Function
+        _append()
+        _append([_cell("OBJECTIVE FUNCTION", font=section_font)])
 
+        # SUMPRODUCT formula
+        cost_range = f"B{cost_start_row}:{end_col}{cost_end_row}"
+        alloc_range = f"B{allocation_start_row}:{end_col}{allocation_end_row}"
+
+        _append([_cell("Total Transportation Cost:", font=Font(bold=True)),
+                 _cell(f"=SUMPRODUCT({cost_range},{alloc_range})",
+                       font=Font(bold=True, size=14),
+                       fill=PatternFill(start_color="92D050", end_color="92D050",
+                                        fill_type="solid"),
+                       number_format='#,##0'),
+                 _cell("Rp thousands", font=Font(italic=True))])
         objective_cell = f"B{row}"
 
         # Section 5: Solver Instructions
-        row += 3
-        ws.cell(row, 1, "SOLVER SETUP INSTRUCTIONS:").font = Font(bold=True, size=12, color="FF0000")
-        row += 1
+        _append()
+        _append()
+        _append([_cell("SOLVER SETUP INSTRUCTIONS:",
+                       font=Font(bold=True, size=12, color="FF0000"))])
 
+        total_col = col_letters[n_dest + 2]
         instructions = [
             "1. Go to Data → Solver (if not visible, enable Solver Add-in)",
             f"2. Set Objective: {objective_cell} (Min)",
-            f"3. By Changing Variable Cells: B{allocation_start_row}:{get_column_letter(len(self.data.destinations)+1)}{allocation_end_row}",
+            f"3. By Changing Variable Cells: B{allocation_start_row}:{end_col}{allocation_end_row}",
             "4. Add Constraints:",
-            f"   a) Total Shipped ≤ Supply: {get_column_letter(len(self.data.destinations)+2)}{allocation_start_row}:{get_column_letter(len(self.data.destinations)+2)}{allocation_end_row} <= B{supply_data_start}:B{supply_data_end}",
-            f"   b) Total Received = Demand: B{total_row}:{get_column_letter(len(self.data.destinations)+1)}{total_row} = E{demand_data_start}:E{demand_data_end}",
-            f"   c) Non-negative: B{allocation_start_row}:{get_column_letter(len(self.data.destinations)+1)}{allocation_end_row} >= 0",
+            f"   a) Total Shipped ≤ Supply: {total_col}{allocation_start_row}:{total_col}{allocation_end_row} <= B{supply_data_start}:B{supply_data_end}",
+            f"   b) Total Received = Demand: B{total_row}:{end_col}{total_row} = E{demand_data_start}:E{demand_data_end}",
+            f"   c) Non-negative: B{allocation_start_row}:{end_col}{allocation_end_row} >= 0",
             "5. Select Solving Method: Simplex LP",
             "6. Click Options → Check 'Make Unconstrained Variables Non-Negative'",
             "7. Click Solve",
             "8. When done, select 'Keep Solver Solution' and generate all reports"
         ]
 
+        instruction_font = Font(size=10)
         for instruction in instructions:
-            ws.cell(row, 1, instruction).font = Font(size=10)
-            row += 1
-
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 25
-        for i in range(2, len(self.data.destinations) + 5):
-            ws.column_dimensions[get_column_letter(i)].width = 15
+            _append([_cell(instruction, font=instruction_font)])
 
         # Save workbook
         wb.save(filename)
@@ -255,8 +268,9 @@ class ExcelSolverHelper:
         if not os.path.exists(filename):
             raise FileNotFoundError(f"File not found: {filename}")
 
-        # Load workbook
-        wb = load_workbook(filename, data_only=True)
+        # Load workbook in read-only mode: the XML is streamed instead of
+        # materialized cell-by-cell as Python objects
+        wb = load_workbook(filename, data_only=True, read_only=True)
         ws = wb.active
 
         # Find allocation matrix
@@ -267,18 +281,24 @@ class ExcelSolverHelper:
         # You would need to adjust these based on actual Excel layout
         allocation_start_row = 15  # Adjust based on template
 
-        for i, warehouse in enumerate(self.data.warehouses):
-            for j, dest in enumerate(self.data.destinations):
-                row = allocation_start_row + i
-                col = 2 + j  # Assuming allocation starts at column B
-                value = ws.cell(row, col).value
-
+        alloc_rows = ws.iter_rows(
+            min_row=allocation_start_row,
+            max_row=allocation_start_row + len(self.data.warehouses) - 1,
+            min_col=2,
+            max_col=1 + len(self.data.destinations),
+            values_only=True
+        )
+        for warehouse, row_values in zip(self.data.warehouses, alloc_rows):
+            for dest, value in zip(self.data.destinations, row_values):
                 if value and value > 0:
                     allocation[(warehouse, dest)] = float(value)
 
         # Read objective value
         # Adjust cell reference based on template
-        objective_value = ws.cell(20, 2).value  # Example cell
+        objective_value = next(ws.iter_rows(min_row=20, max_row=20,
+                                            min_col=2, max_col=2,
+                                            values_only=True))[0]
+        wb.close()
 
         results = {
             'allocation': allocation,
@@ -293,6 +313,26 @@ class ExcelSolverHelper:
 
         return results
 
+    def _alloc_to_matrix(self, allocation):
+        """
+        Convert a tuple-keyed allocation dict to a dense (W x D) ndarray
+
+        One pass over the active routes replaces repeated tuple-hash
+        lookups when the matrix is written out row by row.
+
+        Args:
+            allocation: dict mapping (warehouse, destination) to units
+
+        Returns:
+            np.ndarray of allocated units
+        """
+        matrix = np.zeros((len(self.data.warehouses), len(self.data.destinations)))
+        w_idx = self.data.w_index
+        d_idx = self.data.d_index
+        for (w, d), value in allocation.items():
+            matrix[w_idx[w], d_idx[d]] = value
+        return matrix
+
     def create_comparison_workbook(self, vam_results, excel_results, python_results,
                                    filename='method_comparison.xlsx'):
         """
@@ -306,54 +346,52 @@ class ExcelSolverHelper:
         """
         print(f"Creating comparison workbook: {filename}")
 
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            # Summary comparison
-            summary_data = {
-                'Method': ['VAM (Manual)', 'Excel Solver', 'Python (PuLP)'],
-                'Total Cost (Rp ribu)': [
-                    vam_results.get('total_cost', 0),
-                    excel_results.get('total_cost', 0),
-                    python_results.get('total_cost', 0)
-                ],
-                'Status': [
-                    vam_results.get('status', 'Unknown'),
-                    excel_results.get('status', 'Unknown'),
-                    python_results.get('status', 'Unknown')
-                ],
-                'Active Routes': [
-                    vam_results.get('num_routes', 0),
-                    excel_results.get('num_routes', 0),
-                    python_results.get('num_routes', 0)
-                ],
-                'Solve Time': [
-                    vam_results.get('solve_time', '~15 min'),
-                    excel_results.get('solve_time', '<1 sec'),
-                    python_results.get('solve_time', '<1 sec')
-                ]
-            }
-
-            df_summary = pd.DataFrame(summary_data)
-            df_summary.to_excel(writer, sheet_name='Summary', index=False)
-
-            # Detailed allocation for each method
-            for method_name, results in [
-                ('VAM', vam_results),
-                ('Excel', excel_results),
-                ('Python', python_results)
-            ]:
-                allocation = results.get('allocation', {})
-
-                # Create allocation matrix
-                alloc_data = []
-                for w in self.data.warehouses:
-                    row = {'Warehouse': w}
-                    for d in self.data.destinations:
-                        value = allocation.get((w, d), 0)
-                        row[d] = value if value > 0 else 0
-                    alloc_data.append(row)
-
-                df_alloc = pd.DataFrame(alloc_data)
-                df_alloc.to_excel(writer, sheet_name=f'{method_name}_Allocation', index=False)
+        methods = [
+            ('VAM (Manual)', vam_results, '~15 min'),
+            ('Excel Solver', excel_results, '<1 sec'),
+            ('Python (PuLP)', python_results, '<1 sec')
+        ]
+
+        # Gap of each method against the best cost, computed as one
+        # vector op so adding scenarios stays O(1) per scenario. Methods
+        # without a reported cost (e.g. the Excel workbook not solved yet)
+        # default to 0 and must not be treated as the optimum; their gap
+        # columns stay 0
+        costs_arr = np.array([results.get('total_cost', 0)
+                              for _, results, _ in methods], dtype=np.float64)
+        reported = costs_arr > 0
+        optimal = costs_arr[reported].min() if reported.any() else 0.0
+        gaps = np.where(reported, costs_arr - optimal, 0.0)
+        gap_pcts = np.round(np.divide(gaps, optimal,
+                                      out=np.zeros_like(gaps),
+                                      where=optimal != 0) * 100, 2)
+
+        # Write rows directly with openpyxl; to_excel would walk each cell
+        # through pandas' style/coercion machinery for no benefit here
+        wb = Workbook()
+        ws = wb.active
+        ws.title = 'Summary'
+        ws.append(['Method', 'Total Cost (Rp ribu)', 'Status', 'Active Routes',
+                   'Solve Time', 'Gap vs Optimal (Rp ribu)', 'Gap vs Optimal (%)'])
+
+        for (name, results, default_time), cost, gap, gap_pct in zip(
+                methods, costs_arr, gaps, gap_pcts):
+            ws.append([name, float(cost), results.get('status', 'Unknown'),
+                       results.get('num_routes', 0),
+                       results.get('solve_time', default_time),
+                       float(gap), float(gap_pct)])
+
+        # Detailed allocation for each method
+        for method_name, results, _ in methods:
+            alloc_matrix = self._alloc_to_matrix(results.get('allocation', {}))
+            sheet_name = method_name.split(' ')[0]
+
+            ws_alloc = wb.create_sheet(f'{sheet_name}_Allocation')
+            ws_alloc.append(['Warehouse'] + list(self.data.destinations))
+            for i, w in enumerate(self.data.warehouses):
+                ws_alloc.append([w] + alloc_matrix[i].tolist())
+
+        wb.save(filename)
 
         print(f"✓ Comparison workbook created: {filename}")
 
@@ -369,38 +407,45 @@ class ExcelSolverHelper:
         """
         print(f"Validating Solver setup: {filename}")
 
-        issues = []
+        def _fail(issue):
+            """Report the first failing check and stop"""
+            print("✗ Issues found:")
+            print(f"  - {issue}")
+            return False, [issue]
 
         try:
-            wb = load_workbook(filename, data_only=False)
-            ws = wb.active
-
-            # Check if objective function exists
-            # This is simplified - actual validation would be more comprehensive
-            objective_cell = ws['B20']
-            if not objective_cell.value or not str(objective_cell.value).startswith('='):
-                issues.append("Objective function not found or invalid")
-
-            # Check for allocation matrix
-            allocation_start = ws['B15']
-            if allocation_start.value is None:
-                issues.append("Allocation matrix appears empty")
-
-            # More validation checks could be added here
+            # Read-only mode streams the sheet instead of materializing it;
+            # formulas stay as strings with data_only=False
+            wb = load_workbook(filename, data_only=False, read_only=True,
+                               keep_vba=False, keep_links=False)
+            try:
+                ws = wb.active
+
+                def _cell_value(row_idx, col_idx):
+                    """Fetch one cell value through the streaming reader"""
+                    return next(ws.iter_rows(min_row=row_idx, max_row=row_idx,
+                                             min_col=col_idx, max_col=col_idx,
+                                             values_only=True))[0]
+
+                # Check if objective function exists (fail fast)
+                # This is simplified - actual validation would be more comprehensive
+                objective_value = _cell_value(20, 2)
+                if not objective_value or not str(objective_value).startswith('='):
+                    return _fail("Objective function not found or invalid")
+
+                # Check for allocation matrix
+                if _cell_value(15, 2) is None:
+                    return _fail("Allocation matrix appears empty")
+
+                # More validation checks could be added here
+            finally:
+                wb.close()
 
         except Exception as e:
-            issues.append(f"Error reading file: {str(e)}")
-
-        is_valid = len(issues) == 0
-
-        if is_valid:
-            print("✓ Solver setup is valid")
-        else:
-            print("✗ Issues found:")
-            for issue in issues:
-                print(f"  - {issue}")
+            return _fail(f"Error reading file: {str(e)}")
 
-        return is_valid, issues
+        print("✓ Solver setup is valid")
+        return True, []
 
 
 # Example usage
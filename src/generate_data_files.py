@@ -11,12 +11,31 @@ This script generates all data files needed for the project:
 Run this script first to create all necessary data files.
 """
 
-import pandas as pd
+import io
 import numpy as np
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+import pandas as pd
 import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Traffic categories, indexed by the codes in DataGenerator._traffic_codes
+TRAFFIC_LEVELS = np.array(['Low', 'Medium', 'High'])
+
+# Workbook format specs shared by every sheet builder; registered once per
+# workbook in generate_input_data_xlsx
+HEADER_FMT = {'bold': True, 'font_size': 11, 'bg_color': '#366092',
+              'font_color': 'white'}
+FORMAT_SPECS = {
+    'title': {'bold': True, 'font_size': 14, 'font_color': '#366092'},
+    'section': {'bold': True, 'font_size': 12},
+    'stats_title': {'bold': True, 'font_size': 14},
+    'header': HEADER_FMT,
+    'header_center': {**HEADER_FMT, 'align': 'center'},
+    'header_wrap': {**HEADER_FMT, 'align': 'center', 'text_wrap': True},
+    'cost': {'align': 'center'},
+    'green': {'bg_color': '#C6EFCE', 'border': 1},
+    'yellow': {'bg_color': '#FFEB9C', 'border': 1},
+    'red': {'bg_color': '#FFC7CE', 'border': 1}
+}
 
 
 class DataGenerator:
@@ -72,35 +91,98 @@ class DataGenerator:
             ('Bogor', 'RS_Bogor'): 5
         }
 
+        # Dense cost matrix (warehouses x destinations): contiguous int16
+        # buffer for indexed access and vectorized reductions, instead of
+        # tuple-keyed dict lookups in the hot loops
+        self.cost_matrix = np.array(
+            [[self.costs[(w, d)] for d in self.destinations]
+             for w in self.warehouses],
+            dtype=np.int16
+        )
+
+        # Supply/demand as contiguous arrays plus one-pass aggregate stats:
+        # the Overview and Summary_Statistics sheets only index into these
+        # instead of re-reducing the dicts per sheet
+        self._supply_arr = np.fromiter(self.supply.values(), dtype=np.int32,
+                                       count=len(self.supply))
+        self._demand_arr = np.fromiter(self.demand.values(), dtype=np.int32,
+                                       count=len(self.demand))
+        self._supply_stats = self._describe(self._supply_arr)
+        self._demand_stats = self._describe(self._demand_arr)
+        self._cost_stats = self._describe(self.cost_matrix)
+
+        # Traffic level per route, classified once at init: an int8 code
+        # matrix aligned with cost_matrix, mapped to strings only at the
+        # CSV/xlsx boundary via TRAFFIC_LEVELS fancy indexing
+        level_code = {'Low': 0, 'Medium': 1, 'High': 2}
+        self._traffic_codes = np.array(
+            [[level_code[self._get_traffic_level(w, d)]
+              for d in self.destinations]
+             for w in self.warehouses],
+            dtype=np.int8
+        )
+
+        # Lazily built row tables shared by the CSV and Excel sinks, so
+        # per-route/per-facility fields are computed exactly once
+        self._routes_df = None
+        self._warehouses_df = None
+        self._destinations_df = None
+
+        # Loop-invariant string transforms, computed once instead of per
+        # row in every CSV/sheet pass
+        self._wh_code = {w: w[:3].upper() for w in self.warehouses}
+        self._dest_code = {d: d[:3].upper() for d in self.destinations}
+        self._dest_pretty = {d: d.replace('_', ' ') for d in self.destinations}
+        self._wh_lower = {w: w.lower() for w in self.warehouses}
+
         # Create data directory if not exists
         self.data_dir = '../data'
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir)
             print(f"✓ Created directory: {self.data_dir}")
 
-    def generate_warehouse_capacity_csv(self):
-        """Generate warehouse_capacity.csv"""
+    @staticmethod
+    def _describe(arr):
+        """One-pass summary stats for an integer array"""
+        return {
+            'sum': int(arr.sum()),
+            'mean': round(float(arr.mean()), 2),
+            'std': round(float(arr.std()), 2),
+            'min': int(arr.min()),
+            'max': int(arr.max())
+        }
 
-        filename = f'{self.data_dir}/warehouse_capacity.csv'
+    def _build_warehouses_df(self):
+        """Build (once) the full warehouse table shared by CSV and Excel"""
 
-        # Create DataFrame
-        data = []
-        for warehouse in self.warehouses:
-            data.append({
-                'Warehouse_ID': f'WH_{warehouse[:3].upper()}',
+        if self._warehouses_df is None:
+            self._warehouses_df = pd.DataFrame([{
+                'Warehouse_ID': f'WH_{self._wh_code[warehouse]}',
                 'Warehouse_Name': warehouse,
                 'Location': warehouse,
                 'Capacity_Units': self.supply[warehouse],
                 'Current_Stock': self.supply[warehouse],
                 'Utilization_Percent': 0,  # Will be filled after optimization
                 'Manager': f'{warehouse} Manager',
-                'Contact': f'{warehouse.lower()}@medicare.co.id',
+                'Contact': f'{self._wh_lower[warehouse]}@medicare.co.id',
                 'Operating_Hours': '07:00-17:00',
                 'Status': 'Active'
+            } for warehouse in self.warehouses]).astype({
+                'Capacity_Units': 'int32',
+                'Current_Stock': 'int32',
+                'Utilization_Percent': 'int8'
             })
 
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False)
+        return self._warehouses_df
+
+    def generate_warehouse_capacity_csv(self):
+        """Generate warehouse_capacity.csv"""
+
+        filename = f'{self.data_dir}/warehouse_capacity.csv'
+
+        df = self._build_warehouses_df()
+        df.to_csv(filename, index=False, lineterminator='\n',
+                  columns=list(df.columns))
 
         print(f"✓ Generated: {filename}")
         print(f"  Rows: {len(df)}")
@@ -108,12 +190,12 @@ class DataGenerator:
 
         return df
 
-    def generate_destination_demand_csv(self):
-        """Generate destination_demand.csv"""
+    def _build_destinations_df(self):
+        """Build (once) the full destination table shared by CSV and Excel"""
 
-        filename = f'{self.data_dir}/destination_demand.csv'
+        if self._destinations_df is not None:
+            return self._destinations_df
 
-        # Create DataFrame
         data = []
         for i, destination in enumerate(self.destinations, 1):
             # Determine type
@@ -124,21 +206,32 @@ class DataGenerator:
 
             data.append({
                 'Destination_ID': f'DEST_{i:03d}',
-                'Destination_Name': destination.replace('_', ' '),
+                'Destination_Name': self._dest_pretty[destination],
                 'Facility_Type': facility_type,
-                'Location': destination.replace('_', ' '),
+                'Location': self._dest_pretty[destination],
                 'Monthly_Demand_Units': self.demand[destination],
                 'Priority_Level': 'High' if self.demand[destination] >= 250 else 'Medium',
                 'Service_Days': 'Mon-Sat',
                 'Delivery_Window': '08:00-15:00',
-                'Contact_Person': f'{destination.replace("_", " ")} Procurement',
+                'Contact_Person': f'{self._dest_pretty[destination]} Procurement',
                 'Phone': f'021-{i:04d}-{i*111:04d}',
                 'Email': f'{destination.lower()}@hospital.co.id',
                 'Status': 'Active'
             })
 
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False)
+        self._destinations_df = pd.DataFrame(data).astype({
+            'Monthly_Demand_Units': 'int32'
+        })
+        return self._destinations_df
+
+    def generate_destination_demand_csv(self):
+        """Generate destination_demand.csv"""
+
+        filename = f'{self.data_dir}/destination_demand.csv'
+
+        df = self._build_destinations_df()
+        df.to_csv(filename, index=False, lineterminator='\n',
+                  columns=list(df.columns))
 
         print(f"✓ Generated: {filename}")
         print(f"  Rows: {len(df)}")
@@ -146,41 +239,59 @@ class DataGenerator:
 
         return df
 
+    def _build_routes_df(self):
+        """Build (once) the full routes table shared by CSV and Excel"""
+
+        if self._routes_df is not None:
+            return self._routes_df
+
+        # Route identity columns (warehouse-major order, matching self.costs)
+        routes = [(w, d) for w in self.warehouses for d in self.destinations]
+
+        # Cost column as one array (flat view of the cost matrix, already
+        # warehouse-major); every derived column is then a single vectorized
+        # expression instead of 20 per-row Python computations
+        cost_arr = self.cost_matrix.ravel()
+
+        # Distance (simplified: cost * 5 km) and time (distance / 30 km/h);
+        # distances stay integral so the CSV keeps whole-number kilometres
+        distance_km = cost_arr * 5
+        travel_time_hours = np.round(distance_km / 30, 2)
+
+        # Classify all routes at once instead of calling _get_route_condition
+        # per row (same thresholds)
+        condition = np.select(
+            [cost_arr <= 7, cost_arr <= 15, cost_arr <= 20],
+            ['Excellent', 'Good', 'Fair'],
+            default='Poor'
+        )
+
+        self._routes_df = pd.DataFrame({
+            'Route_ID': [f'{self._wh_code[w]}_{self._dest_code[d]}'
+                         for w, d in routes],
+            'From_Warehouse': [w for w, d in routes],
+            'To_Destination': [self._dest_pretty[d] for w, d in routes],
+            'Distance_KM': distance_km,
+            'Travel_Time_Hours': travel_time_hours,
+            'Cost_Per_Unit_Rp_Thousands': cost_arr,
+            'Fuel_Cost_Rp_Thousands': np.round(cost_arr * 0.6, 2),
+            'Driver_Cost_Rp_Thousands': np.round(cost_arr * 0.25, 2),
+            'Maintenance_Cost_Rp_Thousands': np.round(cost_arr * 0.15, 2),
+            'Route_Condition': condition,
+            'Traffic_Level': TRAFFIC_LEVELS[self._traffic_codes.ravel()],
+            'Preferred_Route': np.where(cost_arr <= 10, 'Yes', 'No'),
+            'Last_Updated': '2025-01-01'
+        })
+        return self._routes_df
+
     def generate_transportation_cost_csv(self):
         """Generate transportation_cost.csv"""
 
         filename = f'{self.data_dir}/transportation_cost.csv'
 
-        # Create DataFrame with all routes
-        data = []
-        for warehouse in self.warehouses:
-            for destination in self.destinations:
-                cost = self.costs[(warehouse, destination)]
-
-                # Calculate distance (simplified: cost * 5 km)
-                distance_km = cost * 5
-
-                # Estimate time (simplified: distance / 30 km/h avg speed)
-                travel_time_hours = distance_km / 30
-
-                data.append({
-                    'Route_ID': f'{warehouse[:3].upper()}_{destination[:3].upper()}',
-                    'From_Warehouse': warehouse,
-                    'To_Destination': destination.replace('_', ' '),
-                    'Distance_KM': round(distance_km, 1),
-                    'Travel_Time_Hours': round(travel_time_hours, 2),
-                    'Cost_Per_Unit_Rp_Thousands': cost,
-                    'Fuel_Cost_Rp_Thousands': round(cost * 0.6, 2),
-                    'Driver_Cost_Rp_Thousands': round(cost * 0.25, 2),
-                    'Maintenance_Cost_Rp_Thousands': round(cost * 0.15, 2),
-                    'Route_Condition': self._get_route_condition(cost),
-                    'Traffic_Level': self._get_traffic_level(warehouse, destination),
-                    'Preferred_Route': 'Yes' if cost <= 10 else 'No',
-                    'Last_Updated': '2025-01-01'
-                })
-
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False)
+        df = self._build_routes_df()
+        df.to_csv(filename, index=False, lineterminator='\n',
+                  columns=list(df.columns))
 
         print(f"✓ Generated: {filename}")
         print(f"  Rows: {len(df)}")
@@ -188,17 +299,6 @@ class DataGenerator:
 
         return df
 
-    def _get_route_condition(self, cost):
-        """Determine route condition based on cost"""
-        if cost <= 7:
-            return 'Excellent'
-        elif cost <= 15:
-            return 'Good'
-        elif cost <= 20:
-            return 'Fair'
-        else:
-            return 'Poor'
-
     def _get_traffic_level(self, warehouse, destination):
         """Determine traffic level based on locations"""
         high_traffic = ['Jakarta', 'Tangerang']
@@ -215,68 +315,66 @@ class DataGenerator:
 
         filename = f'{self.data_dir}/input_data.xlsx'
 
-        # Create Excel workbook
-        wb = Workbook()
-
-        # Remove default sheet
-        if 'Sheet' in wb.sheetnames:
-            wb.remove(wb['Sheet'])
-
-        # Define styles
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=11)
-        title_font = Font(bold=True, size=14, color="366092")
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        # One xlsxwriter-backed ExcelWriter for all sheets: the tabular
+        # sheets are dumped straight from the cached DataFrames through
+        # pandas' C-level Excel serializer. The workbook is assembled in a
+        # BytesIO buffer (in_memory also keeps xlsxwriter off its temp
+        # files) and flushed to disk in a single write syscall at the end
+        buf = io.BytesIO()
+        writer = pd.ExcelWriter(buf, engine='xlsxwriter',
+                                engine_kwargs={'options': {'in_memory': True}})
+        wb = writer.book
+
+        # Register the shared module-level format specs once per workbook
+        fmts = {name: wb.add_format(spec)
+                for name, spec in FORMAT_SPECS.items()}
 
         # Sheet 1: Overview
-        ws_overview = wb.create_sheet("Overview", 0)
-        self._create_overview_sheet(ws_overview, title_font, header_fill, header_font)
+        self._create_overview_sheet(wb.add_worksheet("Overview"), fmts)
 
         # Sheet 2: Warehouse Capacity
-        ws_warehouse = wb.create_sheet("Warehouse_Capacity", 1)
-        self._create_warehouse_sheet(ws_warehouse, header_fill, header_font, border)
+        self._create_warehouse_sheet(writer, fmts)
 
         # Sheet 3: Destination Demand
-        ws_destination = wb.create_sheet("Destination_Demand", 2)
-        self._create_destination_sheet(ws_destination, header_fill, header_font, border)
+        self._create_destination_sheet(writer, fmts)
 
         # Sheet 4: Transportation Costs
-        ws_costs = wb.create_sheet("Transportation_Costs", 3)
-        self._create_costs_sheet(ws_costs, header_fill, header_font, border)
+        self._create_costs_sheet(writer, fmts)
 
         # Sheet 5: Cost Matrix
-        ws_matrix = wb.create_sheet("Cost_Matrix", 4)
-        self._create_cost_matrix_sheet(ws_matrix, header_fill, header_font, border)
+        self._create_cost_matrix_sheet(writer, fmts)
 
         # Sheet 6: Summary Statistics
-        ws_stats = wb.create_sheet("Summary_Statistics", 5)
-        self._create_statistics_sheet(ws_stats, header_fill, header_font, border)
+        self._create_statistics_sheet(wb.add_worksheet("Summary_Statistics"), fmts)
+
+        # Save workbook: serialize to the buffer, then one write() to disk
+        writer.close()
 
-        # Save workbook
-        wb.save(filename)
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, buf.getbuffer())
+        finally:
+            os.close(fd)
 
+        sheet_names = [sheet.get_name() for sheet in wb.worksheets()]
         print(f"✓ Generated: {filename}")
-        print(f"  Sheets: {len(wb.sheetnames)}")
-        print(f"  Sheet names: {', '.join(wb.sheetnames)}")
+        print(f"  Sheets: {len(sheet_names)}")
+        print(f"  Sheet names: {', '.join(sheet_names)}")
 
         return filename
 
-    def _create_overview_sheet(self, ws, title_font, header_fill, header_font):
+    def _create_overview_sheet(self, ws, fmts):
         """Create overview sheet"""
 
-        # Title
-        ws['A1'] = "Transportation Problem - PT. MediCare Indonesia"
-        ws['A1'].font = title_font
-        ws.merge_cells('A1:D1')
+        ws.set_column('A:A', 30)
+        ws.set_column('B:B', 20)
+        ws.set_column('C:C', 15)
+        ws.set_column('D:D', 30)
 
-        # Problem description
-        ws['A3'] = "Problem Description:"
-        ws['A3'].font = Font(bold=True, size=12)
+        # Title (row 1) and problem description (rows 3-11)
+        ws.merge_range('A1:D1', "Transportation Problem - PT. MediCare Indonesia",
+                       fmts['title'])
+        ws.write(2, 0, "Problem Description:", fmts['section'])
 
         description = [
             "This dataset contains information for optimizing pharmaceutical product distribution",
@@ -289,263 +387,159 @@ class DataGenerator:
             "Problem Type: Transportation Problem (Linear Programming)"
         ]
 
-        for i, line in enumerate(description, 4):
-            ws[f'A{i}'] = line
+        for row, line in enumerate(description, 3):
+            ws.write(row, 0, line)
 
-        # Key metrics
-        row = 13
-        ws[f'A{row}'] = "Key Metrics"
-        ws[f'A{row}'].font = Font(bold=True, size=12)
-        row += 1
+        # Key metrics (row 13 onwards)
+        ws.write(12, 0, "Key Metrics", fmts['section'])
 
         metrics = [
-            ['Metric', 'Value', 'Unit'],
             ['Total Warehouses', len(self.warehouses), 'facilities'],
             ['Total Destinations', len(self.destinations), 'facilities'],
-            ['Total Supply Capacity', sum(self.supply.values()), 'units'],
-            ['Total Demand', sum(self.demand.values()), 'units'],
-            ['Supply-Demand Balance', sum(self.supply.values()) - sum(self.demand.values()), 'units'],
-            ['Number of Routes', len(self.costs), 'routes'],
-            ['Min Cost per Unit', min(self.costs.values()), 'Rp thousands'],
-            ['Max Cost per Unit', max(self.costs.values()), 'Rp thousands'],
-            ['Avg Cost per Unit', round(sum(self.costs.values()) / len(self.costs), 2), 'Rp thousands']
+            ['Total Supply Capacity', self._supply_stats['sum'], 'units'],
+            ['Total Demand', self._demand_stats['sum'], 'units'],
+            ['Supply-Demand Balance', self._supply_stats['sum'] - self._demand_stats['sum'], 'units'],
+            ['Number of Routes', self.cost_matrix.size, 'routes'],
+            ['Min Cost per Unit', self._cost_stats['min'], 'Rp thousands'],
+            ['Max Cost per Unit', self._cost_stats['max'], 'Rp thousands'],
+            ['Avg Cost per Unit', self._cost_stats['mean'], 'Rp thousands']
         ]
 
-        for i, metric in enumerate(metrics):
-            for j, value in enumerate(metric, 1):
-                cell = ws.cell(row + i, j, value)
-                if i == 0:
-                    cell.fill = header_fill
-                    cell.font = header_font
+        ws.write_row(13, 0, ['Metric', 'Value', 'Unit'], fmts['header'])
+        for row, metric in enumerate(metrics, 14):
+            ws.write_row(row, 0, metric)
 
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 30
-        ws.column_dimensions['B'].width = 20
-        ws.column_dimensions['C'].width = 15
-        ws.column_dimensions['D'].width = 30
-
-    def _create_warehouse_sheet(self, ws, header_fill, header_font, border):
+    def _create_warehouse_sheet(self, writer, fmts):
         """Create warehouse capacity sheet"""
 
-        # Headers
         headers = ['Warehouse_ID', 'Warehouse_Name', 'Location', 'Capacity_Units',
                    'Status', 'Manager', 'Contact']
 
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(1, col, header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center')
+        ws = writer.book.add_worksheet("Warehouse_Capacity")
+        ws.set_column(0, len(headers) - 1, 20)
+        ws.write_row(0, 0, headers, fmts['header_center'])
 
-        # Data
-        row = 2
-        for warehouse in self.warehouses:
-            ws.cell(row, 1, f'WH_{warehouse[:3].upper()}')
-            ws.cell(row, 2, warehouse)
-            ws.cell(row, 3, warehouse)
-            ws.cell(row, 4, self.supply[warehouse])
-            ws.cell(row, 5, 'Active')
-            ws.cell(row, 6, f'{warehouse} Manager')
-            ws.cell(row, 7, f'{warehouse.lower()}@medicare.co.id')
-            row += 1
-
-        # Adjust column widths
-        for col in range(1, len(headers) + 1):
-            ws.column_dimensions[get_column_letter(col)].width = 20
-
-    def _create_destination_sheet(self, ws, header_fill, header_font, border):
+        # Data block dumped from the same cached table as the CSV
+        df = self._build_warehouses_df()
+        df[headers].to_excel(writer, sheet_name="Warehouse_Capacity",
+                             index=False, header=False, startrow=1)
+
+    def _create_destination_sheet(self, writer, fmts):
         """Create destination demand sheet"""
 
-        # Headers
         headers = ['Destination_ID', 'Destination_Name', 'Facility_Type',
                    'Monthly_Demand_Units', 'Priority_Level', 'Contact_Person']
 
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(1, col, header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center')
+        ws = writer.book.add_worksheet("Destination_Demand")
+        ws.set_column(0, len(headers) - 1, 25)
+        ws.write_row(0, 0, headers, fmts['header_center'])
 
-        # Data
-        row = 2
-        for i, destination in enumerate(self.destinations, 1):
-            facility_type = 'Hospital' if 'RS' in destination else 'Pharmacy'
-            priority = 'High' if self.demand[destination] >= 250 else 'Medium'
-
-            ws.cell(row, 1, f'DEST_{i:03d}')
-            ws.cell(row, 2, destination.replace('_', ' '))
-            ws.cell(row, 3, facility_type)
-            ws.cell(row, 4, self.demand[destination])
-            ws.cell(row, 5, priority)
-            ws.cell(row, 6, f'{destination.replace("_", " ")} Procurement')
-            row += 1
-
-        # Adjust column widths
-        for col in range(1, len(headers) + 1):
-            ws.column_dimensions[get_column_letter(col)].width = 25
-
-    def _create_costs_sheet(self, ws, header_fill, header_font, border):
+        # Data block dumped from the same cached table as the CSV
+        df = self._build_destinations_df()
+        df[headers].to_excel(writer, sheet_name="Destination_Demand",
+                             index=False, header=False, startrow=1)
+
+    def _create_costs_sheet(self, writer, fmts):
         """Create transportation costs sheet"""
 
-        # Headers
         headers = ['Route_ID', 'From_Warehouse', 'To_Destination', 'Distance_KM',
                    'Cost_Per_Unit_Rp_Thousands', 'Route_Condition', 'Traffic_Level']
 
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(1, col, header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center')
+        ws = writer.book.add_worksheet("Transportation_Costs")
+        ws.set_column(0, len(headers) - 1, 22)
+        ws.write_row(0, 0, headers, fmts['header_center'])
 
-        # Data
-        row = 2
-        for warehouse in self.warehouses:
-            for destination in self.destinations:
-                cost = self.costs[(warehouse, destination)]
-                distance = cost * 5
-                condition = self._get_route_condition(cost)
-                traffic = self._get_traffic_level(warehouse, destination)
-
-                ws.cell(row, 1, f'{warehouse[:3].upper()}_{destination[:3].upper()}')
-                ws.cell(row, 2, warehouse)
-                ws.cell(row, 3, destination.replace('_', ' '))
-                ws.cell(row, 4, round(distance, 1))
-                ws.cell(row, 5, cost)
-                ws.cell(row, 6, condition)
-                ws.cell(row, 7, traffic)
-                row += 1
-
-        # Adjust column widths
-        for col in range(1, len(headers) + 1):
-            ws.column_dimensions[get_column_letter(col)].width = 22
-
-    def _create_cost_matrix_sheet(self, ws, header_fill, header_font, border):
+        # Data block dumped from the same cached routes table as the CSV —
+        # distance/condition/traffic are computed exactly once per route
+        df = self._build_routes_df()
+        df[headers].to_excel(writer, sheet_name="Transportation_Costs",
+                             index=False, header=False, startrow=1)
+
+    def _create_cost_matrix_sheet(self, writer, fmts):
         """Create cost matrix sheet"""
 
-        # Title
-        ws['A1'] = "Cost Matrix (Rp thousands per unit)"
-        ws['A1'].font = Font(bold=True, size=12)
-        ws.merge_cells('A1:F1')
-
-        # Headers
-        ws.cell(3, 1, "From \\ To").fill = header_fill
-        ws.cell(3, 1).font = header_font
-
-        for j, dest in enumerate(self.destinations, 2):
-            cell = ws.cell(3, j, dest.replace('_', '\n'))
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', wrap_text=True)
-
-        # Data
-        row = 4
-        for warehouse in self.warehouses:
-            cell = ws.cell(row, 1, warehouse)
-            cell.fill = header_fill
-            cell.font = header_font
-
-            for j, dest in enumerate(self.destinations, 2):
-                cost = self.costs[(warehouse, dest)]
-                cell = ws.cell(row, j, cost)
-                cell.alignment = Alignment(horizontal='center')
-                cell.border = border
-
-                # Color code by cost
-                if cost <= 7:
-                    cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                elif cost <= 15:
-                    cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-                else:
-                    cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-
-            row += 1
-
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 20
-        for col in range(2, len(self.destinations) + 2):
-            ws.column_dimensions[get_column_letter(col)].width = 18
-
-        # Row height for wrapped headers
-        ws.row_dimensions[3].height = 30
-
-    def _create_statistics_sheet(self, ws, header_fill, header_font, border):
+        n_dest = len(self.destinations)
+        ws = writer.book.add_worksheet("Cost_Matrix")
+        ws.set_column(0, 0, 20)
+        ws.set_column(1, n_dest, 18, fmts['cost'])
+        ws.set_row(2, 30)  # wrapped headers
+
+        # Title (row 1)
+        ws.merge_range('A1:F1', "Cost Matrix (Rp thousands per unit)",
+                       fmts['section'])
+
+        # Headers (row 3)
+        ws.write(2, 0, "From \\ To", fmts['header'])
+        for col, dest in enumerate(self.destinations, 1):
+            ws.write(2, col, dest.replace('_', '\n'), fmts['header_wrap'])
+
+        # Row labels (rows 4-7) plus the numeric block dumped in one
+        # to_excel call; centering comes from the column format and the
+        # color bands (with borders) from Excel's conditional formatting
+        for i, warehouse in enumerate(self.warehouses):
+            ws.write(3 + i, 0, warehouse, fmts['header'])
+
+        cost_matrix_df = pd.DataFrame(self.cost_matrix, index=self.warehouses,
+                                      columns=self.destinations)
+        cost_matrix_df.to_excel(writer, sheet_name="Cost_Matrix",
+                                index=False, header=False,
+                                startrow=3, startcol=1)
+
+        data_range = (3, 1, 2 + len(self.warehouses), n_dest)
+        ws.conditional_format(*data_range, {'type': 'cell', 'criteria': '<=',
+                                            'value': 7,
+                                            'format': fmts['green']})
+        ws.conditional_format(*data_range, {'type': 'cell',
+                                            'criteria': 'between',
+                                            'minimum': 8, 'maximum': 15,
+                                            'format': fmts['yellow']})
+        ws.conditional_format(*data_range, {'type': 'cell', 'criteria': '>',
+                                            'value': 15,
+                                            'format': fmts['red']})
+
+    def _create_statistics_sheet(self, ws, fmts):
         """Create summary statistics sheet"""
 
-        # Title
-        ws['A1'] = "Summary Statistics"
-        ws['A1'].font = Font(bold=True, size=14)
-        ws.merge_cells('A1:C1')
-
-        # Supply statistics
-        row = 3
-        ws.cell(row, 1, "Supply Statistics").font = Font(bold=True, size=12)
-        row += 1
-
-        supply_values = list(self.supply.values())
-        stats = [
-            ['Metric', 'Value', 'Unit'],
-            ['Total Supply', sum(supply_values), 'units'],
-            ['Average Capacity', round(np.mean(supply_values), 2), 'units'],
-            ['Std Deviation', round(np.std(supply_values), 2), 'units'],
-            ['Min Capacity', min(supply_values), 'units'],
-            ['Max Capacity', max(supply_values), 'units']
-        ]
-
-        for i, stat in enumerate(stats):
-            for j, value in enumerate(stat, 1):
-                cell = ws.cell(row + i, j, value)
-                if i == 0:
-                    cell.fill = header_fill
-                    cell.font = header_font
-
-        # Demand statistics
-        row += len(stats) + 2
-        ws.cell(row, 1, "Demand Statistics").font = Font(bold=True, size=12)
-        row += 1
-
-        demand_values = list(self.demand.values())
-        stats = [
-            ['Metric', 'Value', 'Unit'],
-            ['Total Demand', sum(demand_values), 'units'],
-            ['Average Demand', round(np.mean(demand_values), 2), 'units'],
-            ['Std Deviation', round(np.std(demand_values), 2), 'units'],
-            ['Min Demand', min(demand_values), 'units'],
-            ['Max Demand', max(demand_values), 'units']
-        ]
-
-        for i, stat in enumerate(stats):
-            for j, value in enumerate(stat, 1):
-                cell = ws.cell(row + i, j, value)
-                if i == 0:
-                    cell.fill = header_fill
-                    cell.font = header_font
-
-        # Cost statistics
-        row += len(stats) + 2
-        ws.cell(row, 1, "Cost Statistics").font = Font(bold=True, size=12)
-        row += 1
-
-        cost_values = list(self.costs.values())
-        stats = [
-            ['Metric', 'Value', 'Unit'],
-            ['Average Cost', round(np.mean(cost_values), 2), 'Rp thousands'],
-            ['Std Deviation', round(np.std(cost_values), 2), 'Rp thousands'],
-            ['Min Cost', min(cost_values), 'Rp thousands'],
-            ['Max Cost', max(cost_values), 'Rp thousands'],
-            ['Total Routes', len(cost_values), 'routes']
+        ws.set_column('A:A', 25)
+        ws.set_column('B:B', 20)
+        ws.set_column('C:C', 15)
+
+        # Title (row 1)
+        ws.merge_range('A1:C1', "Summary Statistics", fmts['stats_title'])
+
+        # Each section: title row, header row, stat rows, two blank
+        # separators; values come from the aggregates cached at init
+        sections = [
+            ("Supply Statistics", [
+                ['Total Supply', self._supply_stats['sum'], 'units'],
+                ['Average Capacity', self._supply_stats['mean'], 'units'],
+                ['Std Deviation', self._supply_stats['std'], 'units'],
+                ['Min Capacity', self._supply_stats['min'], 'units'],
+                ['Max Capacity', self._supply_stats['max'], 'units']
+            ]),
+            ("Demand Statistics", [
+                ['Total Demand', self._demand_stats['sum'], 'units'],
+                ['Average Demand', self._demand_stats['mean'], 'units'],
+                ['Std Deviation', self._demand_stats['std'], 'units'],
+                ['Min Demand', self._demand_stats['min'], 'units'],
+                ['Max Demand', self._demand_stats['max'], 'units']
+            ]),
+            ("Cost Statistics", [
+                ['Average Cost', self._cost_stats['mean'], 'Rp thousands'],
+                ['Std Deviation', self._cost_stats['std'], 'Rp thousands'],
+                ['Min Cost', self._cost_stats['min'], 'Rp thousands'],
+                ['Max Cost', self._cost_stats['max'], 'Rp thousands'],
+                ['Total Routes', self.cost_matrix.size, 'routes']
+            ])
         ]
 
-        for i, stat in enumerate(stats):
-            for j, value in enumerate(stat, 1):
-                cell = ws.cell(row + i, j, value)
-                if i == 0:
-                    cell.fill = header_fill
-                    cell.font = header_font
-
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 25
-        ws.column_dimensions['B'].width = 20
-        ws.column_dimensions['C'].width = 15
+        row = 2
+        for title, stats in sections:
+            ws.write(row, 0, title, fmts['section'])
+            ws.write_row(row + 1, 0, ['Metric', 'Value', 'Unit'], fmts['header'])
+            for offset, stat in enumerate(stats, 2):
+                ws.write_row(row + offset, 0, stat)
+            row += len(stats) + 4
 
     def generate_all_files(self):
         """Generate all data files"""
@@ -555,18 +549,22 @@ class DataGenerator:
         print("="*70)
         print()
 
-        # Generate CSV files
-        self.generate_warehouse_capacity_csv()
-        print()
-
-        self.generate_destination_demand_csv()
-        print()
+        # The four writers are independent (separate output files), so run
+        # them in worker processes and overlap serialization with the
+        # CSV writes; results are collected in submission order so the
+        # summary below still reads the same
+        tasks = [
+            self.generate_warehouse_capacity_csv,
+            self.generate_destination_demand_csv,
+            self.generate_transportation_cost_csv,
+            self.generate_input_data_xlsx
+        ]
 
-        self.generate_transportation_cost_csv()
-        print()
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(task) for task in tasks]
+            for future in futures:
+                future.result()
 
-        # Generate Excel file
-        self.generate_input_data_xlsx()
         print()
 
         print("="*70)
@@ -6,11 +6,29 @@ This module contains the data structures and model formulation
 for the transportation optimization problem.
 """
 
+import io
+import sys
+from itertools import product
+
 import pandas as pd
 import numpy as np
+from functools import cached_property
 from typing import Dict, List, Tuple
 
 
+# LaTeX form of the generic transportation model; independent of instance
+# state, so it lives at module scope and is shared by reference
+LATEX_FORMULATION = r"""
+\begin{align*}
+\text{Minimize: } & Z = \sum_{i=1}^{m} \sum_{j=1}^{n} c_{ij} x_{ij} \\
+\text{Subject to: } \\
+& \sum_{j=1}^{n} x_{ij} \leq s_i, \quad \forall i = 1, 2, \ldots, m \\
+& \sum_{i=1}^{m} x_{ij} = d_j, \quad \forall j = 1, 2, \ldots, n \\
+& x_{ij} \geq 0, \quad \forall i, j
+\end{align*}
+"""
+
+
 class TransportationData:
     """
     Data structure for transportation problem
@@ -73,17 +91,84 @@ class TransportationData:
             ('Bogor', 'RS_Bogor'): 5
         }
 
+        # Dense views of the dicts (see refresh_arrays); the dicts above
+        # stay the mutable source of truth
+        self.refresh_arrays()
+
+    def refresh_arrays(self):
+        """
+        Rebuild the dense arrays and index maps from the dicts
+
+        The dicts are the public mutation surface (sensitivity scenarios
+        edit supply/demand/costs in place, or append warehouses); consumers
+        of the contiguous views call this before reading so the arrays and
+        the memoized derived values reflect the current data. Trivially
+        cheap at this problem size.
+        """
+        self.w_index = {w: i for i, w in enumerate(self.warehouses)}
+        self.d_index = {d: j for j, d in enumerate(self.destinations)}
+        self.cost_matrix = np.array(
+            [[self.costs[(w, d)] for d in self.destinations]
+             for w in self.warehouses],
+            order='C'
+        )
+        self.supply_vec = np.array([self.supply[w] for w in self.warehouses])
+        self.demand_vec = np.array([self.demand[d] for d in self.destinations])
+
+        # Drop memoized derived values so the next access recomputes them
+        for name in ('total_supply', 'total_demand', 'balanced',
+                     'cost_matrix_df', 'supply_df', 'demand_df'):
+            self.__dict__.pop(name, None)
+
+    # The data is immutable after __init__, so derived values are computed
+    # once per instance and cached (summary + export would otherwise rebuild
+    # the same totals and DataFrames three or four times each)
+
+    @cached_property
+    def total_supply(self) -> int:
+        """Total supply capacity across all warehouses"""
+        return int(self.supply_vec.sum())
+
+    @cached_property
+    def total_demand(self) -> int:
+        """Total demand across all destinations"""
+        return int(self.demand_vec.sum())
+
+    @cached_property
+    def balanced(self) -> bool:
+        """Whether total supply equals total demand"""
+        return self.total_supply == self.total_demand
+
+    @cached_property
+    def cost_matrix_df(self) -> pd.DataFrame:
+        """Cost matrix with warehouses as rows and destinations as columns"""
+        return pd.DataFrame(self.cost_matrix,
+                            index=pd.Index(self.warehouses, name='Warehouse'),
+                            columns=self.destinations)
+
+    @cached_property
+    def supply_df(self) -> pd.DataFrame:
+        """Supply data as DataFrame"""
+        return pd.DataFrame(list(self.supply.items()),
+                            columns=['Warehouse', 'Capacity'])
+
+    @cached_property
+    def demand_df(self) -> pd.DataFrame:
+        """Demand data as DataFrame"""
+        return pd.DataFrame(list(self.demand.items()),
+                            columns=['Destination', 'Demand'])
+
     def get_total_supply(self) -> int:
         """Calculate total supply capacity"""
-        return sum(self.supply.values())
+        return self.total_supply
 
     def get_total_demand(self) -> int:
         """Calculate total demand"""
-        return sum(self.demand.values())
+        return self.total_demand
 
     def is_balanced(self) -> bool:
         """Check if the problem is balanced"""
-        return self.get_total_supply() == self.get_total_demand()
+        return self.balanced
 
     def get_cost_matrix(self) -> pd.DataFrame:
         """
@@ -92,68 +177,61 @@ class TransportationData:
         Returns:
             pd.DataFrame: Cost matrix with warehouses as rows and destinations as columns
         """
-        data = []
-        for warehouse in self.warehouses:
-            row = {'Warehouse': warehouse}
-            for destination in self.destinations:
-                row[destination] = self.costs.get((warehouse, destination), np.inf)
-            data.append(row)
-
-        df = pd.DataFrame(data)
-        df.set_index('Warehouse', inplace=True)
-        return df
+        return self.cost_matrix_df
 
     def get_supply_dataframe(self) -> pd.DataFrame:
         """Get supply data as DataFrame"""
-        return pd.DataFrame(list(self.supply.items()),
-                            columns=['Warehouse', 'Capacity'])
+        return self.supply_df
 
     def get_demand_dataframe(self) -> pd.DataFrame:
         """Get demand data as DataFrame"""
-        return pd.DataFrame(list(self.demand.items()),
-                            columns=['Destination', 'Demand'])
+        return self.demand_df
 
     def print_problem_summary(self):
         """Print summary of the transportation problem"""
-        print("="*70)
-        print("TRANSPORTATION PROBLEM - PT. MEDICARE INDONESIA")
-        print("="*70)
-
-        print("\n📦 WAREHOUSES (SUPPLY)")
-        print("-"*70)
-        df_supply = self.get_supply_dataframe()
-        print(df_supply.to_string(index=False))
-        print(f"\nTotal Supply: {self.get_total_supply()} units")
-
-        print("\n📍 DESTINATIONS (DEMAND)")
-        print("-"*70)
-        df_demand = self.get_demand_dataframe()
-        print(df_demand.to_string(index=False))
-        print(f"\nTotal Demand: {self.get_total_demand()} units")
-
-        print("\n💰 TRANSPORTATION COSTS (Rp thousands per unit)")
-        print("-"*70)
-        df_costs = self.get_cost_matrix()
-        print(df_costs.to_string())
-
-        print(f"\n{'='*70}")
-        total_supply = self.get_total_supply()
-        total_demand = self.get_total_demand()
-
-        if self.is_balanced():
-            print("✅ Problem is BALANCED")
-            print(f"   Total Supply = Total Demand = {total_supply} units")
+        # Assemble the report in one buffer and flush it with a single
+        # stdout write instead of dozens of individual print calls
+        buf = io.StringIO()
+        _w = buf.write
+
+        _w("="*70 + "\n")
+        _w("TRANSPORTATION PROBLEM - PT. MEDICARE INDONESIA\n")
+        _w("="*70 + "\n")
+
+        _w("\n📦 WAREHOUSES (SUPPLY)\n")
+        _w("-"*70 + "\n")
+        _w(self.supply_df.to_string(index=False) + "\n")
+        _w(f"\nTotal Supply: {self.total_supply} units\n")
+
+        _w("\n📍 DESTINATIONS (DEMAND)\n")
+        _w("-"*70 + "\n")
+        _w(self.demand_df.to_string(index=False) + "\n")
+        _w(f"\nTotal Demand: {self.total_demand} units\n")
+
+        _w("\n💰 TRANSPORTATION COSTS (Rp thousands per unit)\n")
+        _w("-"*70 + "\n")
+        _w(self.cost_matrix_df.to_string() + "\n")
+
+        _w(f"\n{'='*70}\n")
+        total_supply = self.total_supply
+        total_demand = self.total_demand
+
+        if self.balanced:
+            _w("✅ Problem is BALANCED\n")
+            _w(f"   Total Supply = Total Demand = {total_supply} units\n")
         else:
             diff = total_supply - total_demand
             if diff > 0:
-                print(f"⚠️  Problem is UNBALANCED (Surplus: {diff} units)")
-                print(f"   Total Supply ({total_supply}) > Total Demand ({total_demand})")
-                print("   → Need to add dummy destination")
+                _w(f"⚠️  Problem is UNBALANCED (Surplus: {diff} units)\n")
+                _w(f"   Total Supply ({total_supply}) > Total Demand ({total_demand})\n")
+                _w("   → Need to add dummy destination\n")
             else:
-                print(f"⚠️  Problem is UNBALANCED (Shortage: {-diff} units)")
-                print(f"   Total Supply ({total_supply}) < Total Demand ({total_demand})")
-                print("   → Need to add dummy warehouse")
-        print("="*70)
+                _w(f"⚠️  Problem is UNBALANCED (Shortage: {-diff} units)\n")
+                _w(f"   Total Supply ({total_supply}) < Total Demand ({total_demand})\n")
+                _w("   → Need to add dummy warehouse\n")
+        _w("="*70 + "\n")
+
+        sys.stdout.write(buf.getvalue())
 
     def export_to_excel(self, filename='transportation_data.xlsx'):
         """
@@ -162,7 +240,7 @@ class TransportationData:
         Args:
             filename (str): Output filename
         """
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+        with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
             # Sheet 1: Cost Matrix
             df_costs = self.get_cost_matrix()
             df_costs.to_excel(writer, sheet_name='Cost Matrix')
@@ -208,12 +286,13 @@ class TransportationData:
         """
         errors = []
 
-        # Check if all supplies are positive
+        # Validate the dicts directly: they are the mutation surface, so
+        # checking the cached arrays would miss any edits made since the
+        # last refresh (and at 4-25 elements vectorization buys nothing)
         for warehouse, capacity in self.supply.items():
             if capacity <= 0:
                 errors.append(f"Supply for {warehouse} must be positive")
 
-        # Check if all demands are positive
         for destination, demand in self.demand.items():
             if demand <= 0:
                 errors.append(f"Demand for {destination} must be positive")
@@ -223,11 +302,11 @@ class TransportationData:
             if cost < 0:
                 errors.append(f"Cost from {warehouse} to {destination} cannot be negative")
 
-        # Check if all routes are defined
-        for warehouse in self.warehouses:
-            for destination in self.destinations:
-                if (warehouse, destination) not in self.costs:
-                    errors.append(f"Cost not defined for route {warehouse} → {destination}")
+        # Check if all routes are defined (set difference against the
+        # dict keys instead of an M*N membership loop)
+        missing = set(product(self.warehouses, self.destinations)) - self.costs.keys()
+        for warehouse, destination in sorted(missing):
+            errors.append(f"Cost not defined for route {warehouse} → {destination}")
 
         is_valid = len(errors) == 0
         return is_valid, errors
@@ -247,66 +326,80 @@ class ModelFormulation:
         """
         self.data = data
 
+        # Precomputed display helpers so the print paths do no per-call
+        # string work or tuple-keyed dict lookups
+        self._pretty_dest = [d.replace('_', ' ') for d in data.destinations]
+        self._w_idx = data.w_index
+        self._d_idx = data.d_index
+
     def print_mathematical_formulation(self):
         """Print the mathematical formulation"""
-        print("\n" + "="*70)
-        print("MATHEMATICAL FORMULATION")
-        print("="*70)
-
-        print("\n📊 DECISION VARIABLES:")
-        print("-"*70)
-        print("x_ij = Amount shipped from warehouse i to destination j")
-        print(f"where i ∈ {{{', '.join(self.data.warehouses)}}}")
-        print(f"      j ∈ {{{', '.join([d.replace('_', ' ') for d in self.data.destinations])}}}")
-
-        print("\n🎯 OBJECTIVE FUNCTION:")
-        print("-"*70)
-        print("Minimize Z = Σ Σ c_ij × x_ij")
-        print("             i j")
-        print("\nExpanded form:")
-
-        obj_terms = []
-        for i, warehouse in enumerate(self.data.warehouses, 1):
-            for j, destination in enumerate(self.data.destinations, 1):
-                cost = self.data.costs[(warehouse, destination)]
-                obj_terms.append(f"{cost}x_{i}{j}")
+        # Same single-buffer pattern as print_problem_summary: one stdout
+        # write at the end instead of ~40 print calls
+        buf = io.StringIO()
+        _w = buf.write
+
+        _w("\n" + "="*70 + "\n")
+        _w("MATHEMATICAL FORMULATION\n")
+        _w("="*70 + "\n")
+
+        _w("\n📊 DECISION VARIABLES:\n")
+        _w("-"*70 + "\n")
+        _w("x_ij = Amount shipped from warehouse i to destination j\n")
+        _w(f"where i ∈ {{{', '.join(self.data.warehouses)}}}\n")
+        _w(f"      j ∈ {{{', '.join(self._pretty_dest)}}}\n")
+
+        _w("\n🎯 OBJECTIVE FUNCTION:\n")
+        _w("-"*70 + "\n")
+        _w("Minimize Z = Σ Σ c_ij × x_ij\n")
+        _w("             i j\n")
+        _w("\nExpanded form:\n")
+
+        # One contiguous scan over the dense cost matrix instead of
+        # M*N tuple-keyed dict lookups
+        cost_mat = self.data.cost_matrix
+        n_dest = len(self.data.destinations)
+        obj_terms = [f"{cost_mat[i, j]}x_{i + 1}{j + 1}"
+                     for i in range(len(self.data.warehouses))
+                     for j in range(n_dest)]
 
         # Print in chunks of 4 terms per line
         chunk_size = 4
         for i in range(0, len(obj_terms), chunk_size):
             chunk = obj_terms[i:i+chunk_size]
             if i == 0:
-                print("Z = " + " + ".join(chunk))
+                _w("Z = " + " + ".join(chunk) + "\n")
             else:
-                print("    + " + " + ".join(chunk))
+                _w("    + " + " + ".join(chunk) + "\n")
 
-        print("\n📐 CONSTRAINTS:")
-        print("-"*70)
+        _w("\n📐 CONSTRAINTS:\n")
+        _w("-"*70 + "\n")
 
-        print("\nA. Supply Constraints (Capacity):")
+        _w("\nA. Supply Constraints (Capacity):\n")
         for i, warehouse in enumerate(self.data.warehouses, 1):
             capacity = self.data.supply[warehouse]
             terms = [f"x_{i}{j}" for j in range(1, len(self.data.destinations) + 1)]
-            print(f"   {' + '.join(terms)} ≤ {capacity}  ({warehouse})")
+            _w(f"   {' + '.join(terms)} ≤ {capacity}  ({warehouse})\n")
 
-        print("\nB. Demand Constraints (Requirements):")
+        _w("\nB. Demand Constraints (Requirements):\n")
         for j, destination in enumerate(self.data.destinations, 1):
             demand = self.data.demand[destination]
             terms = [f"x_{i}{j}" for i in range(1, len(self.data.warehouses) + 1)]
-            dest_name = destination.replace('_', ' ')
-            print(f"   {' + '.join(terms)} = {demand}  ({dest_name})")
+            _w(f"   {' + '.join(terms)} = {demand}  ({self._pretty_dest[j - 1]})\n")
 
-        print("\nC. Non-negativity Constraints:")
-        print("   x_ij ≥ 0, for all i and j")
+        _w("\nC. Non-negativity Constraints:\n")
+        _w("   x_ij ≥ 0, for all i and j\n")
 
-        print("\n" + "="*70)
-        print("PROBLEM STATISTICS")
-        print("="*70)
-        print(f"Number of Variables: {len(self.data.warehouses) * len(self.data.destinations)}")
-        print(f"Number of Constraints: {len(self.data.warehouses) + len(self.data.destinations)}")
-        print(f"  - Supply Constraints: {len(self.data.warehouses)}")
-        print(f"  - Demand Constraints: {len(self.data.destinations)}")
-        print("="*70)
+        _w("\n" + "="*70 + "\n")
+        _w("PROBLEM STATISTICS\n")
+        _w("="*70 + "\n")
+        _w(f"Number of Variables: {len(self.data.warehouses) * len(self.data.destinations)}\n")
+        _w(f"Number of Constraints: {len(self.data.warehouses) + len(self.data.destinations)}\n")
+        _w(f"  - Supply Constraints: {len(self.data.warehouses)}\n")
+        _w(f"  - Demand Constraints: {len(self.data.destinations)}\n")
+        _w("="*70 + "\n")
+
+        sys.stdout.write(buf.getvalue())
 
     def get_latex_formulation(self) -> str:
         """
@@ -315,16 +408,7 @@ class ModelFormulation:
         Returns:
             str: LaTeX code for the formulation
         """
-        latex = r"""
-\begin{align*}
-\text{Minimize: } & Z = \sum_{i=1}^{m} \sum_{j=1}^{n} c_{ij} x_{ij} \\
-\text{Subject to: } \\
-& \sum_{j=1}^{n} x_{ij} \leq s_i, \quad \forall i = 1, 2, \ldots, m \\
-& \sum_{i=1}^{m} x_{ij} = d_j, \quad \forall j = 1, 2, \ldots, n \\
-& x_{ij} \geq 0, \quad \forall i, j
-\end{align*}
-"""
-        return latex
+        return LATEX_FORMULATION
 
 
 # Example usage
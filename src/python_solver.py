@@ -3,110 +3,157 @@ Transportation Problem Solver - PT. MediCare Indonesia
 Menggunakan PuLP untuk Linear Programming
 """
 
+import io
+import os
+import sys
+
 import pulp
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+from model_formulation import TransportationData
+
+# Satu instance solver CBC dipakai ulang untuk semua pemanggilan solve();
+# membuat objek solver per panggilan hanya menambah overhead pada sweep
+# berulang (mis. analisis sensitivitas)
+_CBC_SOLVER = pulp.PULP_CBC_CMD(msg=1, keepFiles=False)
+
+
+class _SolvedValue:
+    """Pengganti ringan LpVariable yang hanya menyimpan nilai solusi"""
+
+    __slots__ = ('varValue',)
+
+    def __init__(self, value):
+        self.varValue = value
+
 
 class TransportationOptimizer:
-    def __init__(self):
-        """Inisialisasi data untuk masalah transportasi"""
-
-        # Data Gudang (Supply)
-        self.warehouses = ['Jakarta', 'Tangerang', 'Bekasi', 'Bogor']
-        self.supply = {
-            'Jakarta': 350,
-            'Tangerang': 400,
-            'Bekasi': 300,
-            'Bogor': 250
-        }
-
-        # Data Tujuan (Demand)
-        self.destinations = ['RS_Jakarta_Pusat', 'RS_Tangerang', 'RS_Bekasi',
-                             'Apotek_Depok', 'RS_Bogor']
-        self.demand = {
-            'RS_Jakarta_Pusat': 250,
-            'RS_Tangerang': 300,
-            'RS_Bekasi': 200,
-            'Apotek_Depok': 280,
-            'RS_Bogor': 220
-        }
-
-        # Biaya Transportasi (dalam ribu Rupiah per unit)
-        self.costs = {
-            ('Jakarta', 'RS_Jakarta_Pusat'): 5,
-            ('Jakarta', 'RS_Tangerang'): 15,
-            ('Jakarta', 'RS_Bekasi'): 12,
-            ('Jakarta', 'Apotek_Depok'): 8,
-            ('Jakarta', 'RS_Bogor'): 18,
-
-            ('Tangerang', 'RS_Jakarta_Pusat'): 18,
-            ('Tangerang', 'RS_Tangerang'): 4,
-            ('Tangerang', 'RS_Bekasi'): 20,
-            ('Tangerang', 'Apotek_Depok'): 16,
-            ('Tangerang', 'RS_Bogor'): 25,
-
-            ('Bekasi', 'RS_Jakarta_Pusat'): 14,
-            ('Bekasi', 'RS_Tangerang'): 22,
-            ('Bekasi', 'RS_Bekasi'): 6,
-            ('Bekasi', 'Apotek_Depok'): 10,
-            ('Bekasi', 'RS_Bogor'): 20,
-
-            ('Bogor', 'RS_Jakarta_Pusat'): 16,
-            ('Bogor', 'RS_Tangerang'): 24,
-            ('Bogor', 'RS_Bekasi'): 18,
-            ('Bogor', 'Apotek_Depok'): 7,
-            ('Bogor', 'RS_Bogor'): 5
-        }
+    def __init__(self, data=None):
+        """Inisialisasi optimizer untuk masalah transportasi
+
+        Args:
+            data: instance TransportationData; bila None, dataset
+                  PT. MediCare default yang dipakai
+        """
+
+        # Data masalah dipegang lewat komposisi — definisi gudang/tujuan/
+        # biaya hanya ada di TransportationData, dan array SoA ter-cache
+        # (matriks biaya, vektor supply/demand, peta nama->indeks) ikut
+        # terpakai bersama. Atribut di bawah adalah alias ke objek yang
+        # sama supaya seluruh kode lama tetap membaca self.warehouses dst.
+        self.data = data if data is not None else TransportationData()
+        self.warehouses = self.data.warehouses
+        self.supply = self.data.supply
+        self.destinations = self.data.destinations
+        self.demand = self.data.demand
+        self.costs = self.data.costs
+        self._refresh_arrays()
 
         self.model = None
         self.solution = None
+        self.alloc_mat = None
+        self.total_cost = None
+
+    def _refresh_arrays(self):
+        """Segarkan alias array SoA dari dict masalah
+
+        Skenario sensitivitas memutasi dict costs/supply/demand (atau
+        menambah gudang) secara langsung; setiap jalur solve memanggil ini
+        dulu supaya array padat yang dibacanya mencerminkan data terkini.
+        """
+        self.data.refresh_arrays()
+        self.w_index = self.data.w_index
+        self.d_index = self.data.d_index
+        self.cost_mat = self.data.cost_matrix
+        self.supply_vec = self.data.supply_vec
+        self.demand_vec = self.data.demand_vec
 
     def build_model(self):
         """Membangun model optimasi"""
 
+        # Baca ulang dict masalah agar model memuat data terkini
+        self._refresh_arrays()
+
         # Inisialisasi model
         self.model = pulp.LpProblem("Transportation_Problem", pulp.LpMinimize)
 
+        n_d = len(self.destinations)
+
         # Variabel keputusan
-        # x[i,j] = jumlah unit yang dikirim dari gudang i ke tujuan j
-        self.x = pulp.LpVariable.dicts("Route",
-                                       ((w, d) for w in self.warehouses
-                                        for d in self.destinations),
-                                       lowBound=0,
-                                       cat='Continuous')
-
-        # Fungsi Tujuan: Minimasi total biaya
-        self.model += pulp.lpSum([self.costs[(w, d)] * self.x[(w, d)]
-                                  for w in self.warehouses
-                                  for d in self.destinations]), "Total_Cost"
+        # x[i,j] = jumlah unit yang dikirim dari gudang i ke tujuan j;
+        # dibuat sebagai list datar warehouse-major
+        vars_flat = [pulp.LpVariable(f"Route_('{w}',_'{d}')", lowBound=0,
+                                     cat='Continuous')
+                     for w in self.warehouses
+                     for d in self.destinations]
+
+        self.x = {(w, d): vars_flat[i * n_d + j]
+                  for i, w in enumerate(self.warehouses)
+                  for j, d in enumerate(self.destinations)}
+
+        # Grid variabel dengan indeks integer; akses xmat[i][j] menghindari
+        # alokasi tuple + hash dua string pada setiap lookup x[(w, d)]
+        self.xmat = [vars_flat[i * n_d:(i + 1) * n_d]
+                     for i in range(len(self.warehouses))]
+
+        # Fungsi Tujuan: Minimasi total biaya. LpAffineExpression dibangun
+        # sekali dari pasangan (variabel, koefisien) — tanpa rantai __add__
+        # antar-ekspresi seperti pada lpSum
+        self.model += pulp.LpAffineExpression(
+            [(vars_flat[i * n_d + j], self.cost_mat[i, j].item())
+             for i in range(len(self.warehouses))
+             for j in range(n_d)]
+        ), "Total_Cost"
 
         # Kendala Kapasitas Gudang (Supply Constraints)
-        for w in self.warehouses:
-            self.model += (pulp.lpSum([self.x[(w, d)] for d in self.destinations])
-                           <= self.supply[w],
-                           f"Supply_{w}")
+        # Referensi kendala disimpan agar shadow price/slack bisa dibaca
+        # langsung tanpa lookup nama via model.constraints[f"Supply_{w}"]
+        self.supply_constraints = []
+        for i, w in enumerate(self.warehouses):
+            lhs = pulp.LpAffineExpression(
+                [(v, 1) for v in self.xmat[i]])
+            constraint = lhs <= self.supply_vec[i].item()
+            self.model += (constraint, f"Supply_{w}")
+            self.supply_constraints.append(constraint)
 
         # Kendala Permintaan Tujuan (Demand Constraints)
-        for d in self.destinations:
-            self.model += (pulp.lpSum([self.x[(w, d)] for w in self.warehouses])
-                           == self.demand[d],
-                           f"Demand_{d}")
+        self.demand_constraints = []
+        for j, d in enumerate(self.destinations):
+            lhs = pulp.LpAffineExpression(
+                [(vars_flat[i * n_d + j], 1)
+                 for i in range(len(self.warehouses))])
+            constraint = lhs == self.demand_vec[j].item()
+            self.model += (constraint, f"Demand_{d}")
+            self.demand_constraints.append(constraint)
 
         print("✓ Model berhasil dibangun!")
         print(f"  - Jumlah variabel: {len(self.x)}")
         print(f"  - Jumlah kendala: {len(self.model.constraints)}")
 
-    def solve(self):
-        """Menyelesaikan model optimasi"""
+    def solve(self, use_pulp=False):
+        """Menyelesaikan model optimasi
+
+        Default memakai scipy linprog (HiGHS, in-process) karena untuk 20
+        variabel overhead subprocess CBC jauh melebihi waktu simplex-nya.
+        Model yang sudah dibangun eksplisit lewat build_model() tetap
+        diselesaikan CBC, sehingga pola lama build_model(); solve();
+        pulp.value(model.objective) terus berfungsi; use_pulp=True
+        memaksa jalur PuLP+CBC.
+        """
+
+        if not use_pulp and self.model is None:
+            return self.solve_linprog()
+
+        if self.model is None:
+            self.build_model()
 
         print("\n" + "="*60)
         print("Memulai proses optimasi...")
         print("="*60)
 
         # Selesaikan model
-        self.model.solve(pulp.PULP_CBC_CMD(msg=1))
+        self.model.solve(_CBC_SOLVER)
 
         # Status solusi
         status = pulp.LpStatus[self.model.status]
@@ -114,21 +161,218 @@ class TransportationOptimizer:
 
         if status == 'Optimal':
             # Ekstrak solusi
+            self.alloc_mat = None  # cache alokasi dibangun ulang saat diminta
             self.solution = {}
-            for w in self.warehouses:
-                for d in self.destinations:
-                    value = self.x[(w, d)].varValue
+            for i, w in enumerate(self.warehouses):
+                for j, d in enumerate(self.destinations):
+                    value = self.xmat[i][j].varValue
                     if value > 0:
                         self.solution[(w, d)] = value
 
+            self.total_cost = float(pulp.value(self.model.objective))
             print(f"✓ Solusi optimal ditemukan!")
-            print(f"  Total Biaya Minimum: Rp {pulp.value(self.model.objective):,.0f},000")
+            print(f"  Total Biaya Minimum: Rp {self.total_cost:,.0f},000")
 
             return True
         else:
             print("✗ Solusi optimal tidak ditemukan!")
             return False
 
+    def solve_linprog(self):
+        """Menyelesaikan masalah dengan scipy.optimize.linprog (HiGHS)
+
+        Alternatif solve() tanpa subprocess CBC: model dibangun langsung
+        sebagai array NumPy padat sehingga tidak ada fork/exec maupun
+        penulisan file LP. Untuk masalah sekecil ini overhead proses CBC
+        jauh lebih besar daripada penyelesaian LP-nya sendiri.
+        """
+        from scipy.optimize import linprog
+
+        self._refresh_arrays()
+
+        n_w = len(self.warehouses)
+        n_d = len(self.destinations)
+        n = n_w * n_d
+
+        # Vektor biaya: variabel diurutkan per gudang, lalu per tujuan
+        # (pandangan rata dari matriks biaya C-order)
+        c = self.cost_mat.ravel().astype(np.float64)
+
+        # Kendala kapasitas gudang (<=)
+        A_ub = np.zeros((n_w, n))
+        for i in range(n_w):
+            A_ub[i, i * n_d:(i + 1) * n_d] = 1
+        b_ub = self.supply_vec.astype(np.float64)
+
+        # Kendala permintaan tujuan (=)
+        A_eq = np.zeros((n_d, n))
+        for j in range(n_d):
+            A_eq[j, j::n_d] = 1
+        b_eq = self.demand_vec.astype(np.float64)
+
+        print("\n" + "="*60)
+        print("Memulai proses optimasi (scipy linprog)...")
+        print("="*60)
+
+        res = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq,
+                      bounds=(0, None), method='highs')
+
+        if not res.success:
+            print(f"✗ Solusi optimal tidak ditemukan! ({res.message})")
+            return False
+
+        # Isi self.x dengan shim agar display/visualisasi/export tetap jalan.
+        # Struktur masalah totally unimodular dengan supply/demand integer,
+        # jadi optimum LP kontinu sudah integral — cukup rint, tanpa MIP
+        X = res.x.reshape(n_w, n_d)
+        self.alloc_mat = np.rint(X).astype(np.int32)
+        self.x = {(w, d): _SolvedValue(float(X[i, j]))
+                  for i, w in enumerate(self.warehouses)
+                  for j, d in enumerate(self.destinations)}
+        self.xmat = [[self.x[(w, d)] for d in self.destinations]
+                     for w in self.warehouses]
+
+        self.solution = {(w, d): var.varValue
+                         for (w, d), var in self.x.items()
+                         if var.varValue > 0}
+
+        print(f"\nStatus Solusi: Optimal")
+        print(f"✓ Solusi optimal ditemukan!")
+        self.total_cost = float(res.fun)
+        print(f"  Total Biaya Minimum: Rp {self.total_cost:,.0f},000")
+
+        return True
+
+    def solve_mincostflow(self):
+        """Menyelesaikan masalah sebagai min-cost flow (network simplex)
+
+        Masalah transportasi berstruktur totally unimodular, jadi network
+        simplex memberi solusi optimal integral tanpa tableau LP umum.
+        Memakai networkx (opsional); bila tidak terpasang, jatuh kembali
+        ke solve_linprog().
+        """
+        try:
+            import networkx as nx
+        except ImportError:
+            print("⚠ networkx tidak terpasang, memakai scipy linprog")
+            return self.solve_linprog()
+
+        print("\n" + "="*60)
+        print("Memulai proses optimasi (network simplex)...")
+        print("="*60)
+
+        self._refresh_arrays()
+
+        # Graf bipartit gudang -> tujuan; surplus supply diserap node
+        # dummy berbiaya 0 supaya total demand seimbang (syarat network
+        # simplex)
+        surplus = int(self.supply_vec.sum() - self.demand_vec.sum())
+
+        G = nx.DiGraph()
+        for i, w in enumerate(self.warehouses):
+            G.add_node(w, demand=-int(self.supply_vec[i]))
+        for j, d in enumerate(self.destinations):
+            G.add_node(d, demand=int(self.demand_vec[j]))
+        for i, w in enumerate(self.warehouses):
+            for j, d in enumerate(self.destinations):
+                G.add_edge(w, d, weight=int(self.cost_mat[i, j]))
+
+        if surplus > 0:
+            G.add_node('_dummy', demand=surplus)
+            for w in self.warehouses:
+                G.add_edge(w, '_dummy', weight=0)
+
+        try:
+            flow_cost, flow_dict = nx.network_simplex(G)
+        except nx.NetworkXUnfeasible:
+            print("✗ Solusi optimal tidak ditemukan! (infeasible)")
+            return False
+
+        # Isi self.x dengan shim agar display/visualisasi/export tetap jalan
+        self.x = {(w, d): _SolvedValue(float(flow_dict[w].get(d, 0)))
+                  for w in self.warehouses
+                  for d in self.destinations}
+        self.xmat = [[self.x[(w, d)] for d in self.destinations]
+                     for w in self.warehouses]
+        self.alloc_mat = np.array([[var.varValue for var in row]
+                                   for row in self.xmat]).astype(np.int32)
+
+        self.solution = {(w, d): var.varValue
+                         for (w, d), var in self.x.items()
+                         if var.varValue > 0}
+
+        print(f"\nStatus Solusi: Optimal")
+        print(f"✓ Solusi optimal ditemukan!")
+        self.total_cost = float(flow_cost)
+        print(f"  Total Biaya Minimum: Rp {self.total_cost:,.0f},000")
+
+        return True
+
+    def solve_numba(self):
+        """Menyelesaikan masalah dengan kernel MODI di transport_numba
+
+        Untuk sweep parameter (ribuan skenario biaya/kapasitas) jalur LP
+        per panggilan jadi bottleneck; kernel ini bekerja langsung pada
+        array padat dan dikompilasi Numba bila tersedia (tanpa Numba
+        tetap jalan sebagai Python biasa).
+        """
+        from transport_numba import solve_transport
+
+        print("="*70)
+        print("MENYELESAIKAN MASALAH OPTIMASI (stepping-stone/MODI)")
+        print("="*70)
+
+        self._refresh_arrays()
+
+        # Seimbangkan masalah: surplus supply diserap kolom dummy berbiaya 0
+        cost = self.cost_mat.astype(np.float64)
+        supply = self.supply_vec.astype(np.float64)
+        demand = self.demand_vec.astype(np.float64)
+        surplus = supply.sum() - demand.sum()
+        if surplus > 0:
+            cost = np.hstack([cost, np.zeros((len(self.warehouses), 1))])
+            demand = np.append(demand, surplus)
+
+        alloc, obj = solve_transport(cost, supply, demand)
+
+        # Buang kolom dummy lalu isi struktur solusi yang sama dengan
+        # jalur solver lain
+        n_d = len(self.destinations)
+        X = np.ascontiguousarray(alloc[:, :n_d])
+        self.alloc_mat = np.rint(X).astype(np.int32)
+        self.x = {(w, d): _SolvedValue(float(X[i, j]))
+                  for i, w in enumerate(self.warehouses)
+                  for j, d in enumerate(self.destinations)}
+        self.xmat = [[self.x[(w, d)] for d in self.destinations]
+                     for w in self.warehouses]
+        self.solution = {(w, d): var.varValue
+                         for (w, d), var in self.x.items()
+                         if var.varValue > 0}
+
+        print(f"\nStatus Solusi: Optimal")
+        print(f"✓ Solusi optimal ditemukan!")
+        self.total_cost = float(obj)
+        print(f"  Total Biaya Minimum: Rp {self.total_cost:,.0f},000")
+
+        return True
+
+    def _extract_alloc(self):
+        """Matriks alokasi padat (gudang x tujuan) dari solusi, di-cache
+
+        Ekstraksi varValue per sel hanya terjadi sekali per solve;
+        display_results, visualize_solution, dan export_to_excel semuanya
+        membaca matriks yang sama.
+        """
+        if self.alloc_mat is None:
+            n_w = len(self.warehouses)
+            n_d = len(self.destinations)
+            vals = np.fromiter(
+                (var.varValue or 0.0 for row in self.xmat for var in row),
+                dtype=np.float64, count=n_w * n_d
+            ).reshape(n_w, n_d)
+            self.alloc_mat = np.rint(vals).astype(np.int32)
+        return self.alloc_mat
+
     def display_results(self):
         """Menampilkan hasil solusi"""
 
@@ -136,76 +380,75 @@ class TransportationOptimizer:
             print("Tidak ada solusi untuk ditampilkan!")
             return
 
-        print("\n" + "="*60)
-        print("HASIL OPTIMASI - ALOKASI PENGIRIMAN")
-        print("="*60)
+        # Seluruh laporan dirakit di buffer dan ditulis ke stdout sekali
+        # di akhir, bukan puluhan write kecil per baris
+        buf = io.StringIO()
+        _w = buf.write
+
+        _w("\n" + "="*60 + "\n")
+        _w("HASIL OPTIMASI - ALOKASI PENGIRIMAN\n")
+        _w("="*60 + "\n")
+
+        # Semua agregat di bawah (total baris/kolom, biaya, utilisasi)
+        # diturunkan dari matriks alokasi ter-cache, tanpa mengulang
+        # lookup varValue per sel
+        X = self._extract_alloc()
+        C = self.cost_mat.astype(np.float64)
+        row_sums = X.sum(axis=1)
+        col_sums = X.sum(axis=0)
 
         # Tabel alokasi
-        print("\nAlokasi Pengiriman (unit):")
-        print("-" * 60)
-
-        allocation_matrix = []
-        for w in self.warehouses:
-            row = [w]
-            total_sent = 0
-            for d in self.destinations:
-                value = self.x[(w, d)].varValue if self.x[(w, d)].varValue else 0
-                row.append(value)
-                total_sent += value
-            row.append(total_sent)
-            allocation_matrix.append(row)
-
-        # Tambahkan total permintaan
-        total_row = ['TOTAL']
-        for d in self.destinations:
-            total = sum(self.x[(w, d)].varValue if self.x[(w, d)].varValue else 0
-                        for w in self.warehouses)
-            total_row.append(total)
-        total_row.append(sum([row[-1] for row in allocation_matrix]))
-        allocation_matrix.append(total_row)
-
-        # Buat DataFrame
+        _w("\nAlokasi Pengiriman (unit):\n")
+        _w("-" * 60 + "\n")
+
+        # Blok numerik dirakit sebagai satu array C-order sehingga pandas
+        # membungkus buffer kontigu, bukan baris-baris campuran object
+        alloc_block = np.vstack([
+            np.hstack([X, row_sums[:, None]]),
+            np.append(col_sums, row_sums.sum()),
+        ])
         df_allocation = pd.DataFrame(
-            allocation_matrix,
-            columns=['Gudang'] + self.destinations + ['Total Dikirim']
+            alloc_block,
+            columns=self.destinations + ['Total Dikirim']
         )
-        print(df_allocation.to_string(index=False))
+        df_allocation.insert(0, 'Gudang', self.warehouses + ['TOTAL'])
+        _w(df_allocation.to_string(index=False) + "\n")
 
         # Ringkasan biaya
-        print("\n" + "="*60)
-        print("RINGKASAN BIAYA")
-        print("="*60)
-
-        total_cost = 0
-        cost_breakdown = []
-
-        for (w, d), quantity in self.solution.items():
-            cost = self.costs[(w, d)] * quantity
-            total_cost += cost
-            cost_breakdown.append({
-                'Dari': w,
-                'Ke': d,
-                'Jumlah (unit)': quantity,
-                'Biaya/unit (Rp ribuan)': self.costs[(w, d)],
-                'Total Biaya (Rp ribuan)': cost
-            })
-
-        df_cost = pd.DataFrame(cost_breakdown)
-        print(df_cost.to_string(index=False))
-
-        print(f"\n{'='*60}")
-        print(f"TOTAL BIAYA TRANSPORTASI: Rp {total_cost:,.0f},000")
-        print(f"{'='*60}")
+        _w("\n" + "="*60 + "\n")
+        _w("RINGKASAN BIAYA\n")
+        _w("="*60 + "\n")
+
+        # Rute aktif sebagai array paralel (SoA); DataFrame dibangun
+        # kolom-per-kolom dari array kontigu, tanpa dict per baris
+        total_cost = float((C * X).sum())
+        from_idx, to_idx = np.nonzero(X > 0)
+        qty = X[from_idx, to_idx]
+        unit_cost = C[from_idx, to_idx]
+
+        wh_labels = np.array(self.warehouses, dtype=object)
+        dest_labels = np.array(self.destinations, dtype=object)
+        df_cost = pd.DataFrame({
+            'Dari': wh_labels[from_idx],
+            'Ke': dest_labels[to_idx],
+            'Jumlah (unit)': qty,
+            'Biaya/unit (Rp ribuan)': unit_cost,
+            'Total Biaya (Rp ribuan)': qty * unit_cost
+        })
+        _w(df_cost.to_string(index=False) + "\n")
+
+        _w(f"\n{'='*60}\n")
+        _w(f"TOTAL BIAYA TRANSPORTASI: Rp {total_cost:,.0f},000\n")
+        _w(f"{'='*60}\n")
 
         # Utilisasi kapasitas
-        print("\n" + "="*60)
-        print("UTILISASI KAPASITAS GUDANG")
-        print("="*60)
+        _w("\n" + "="*60 + "\n")
+        _w("UTILISASI KAPASITAS GUDANG\n")
+        _w("="*60 + "\n")
 
         utilization = []
-        for w in self.warehouses:
-            used = sum(self.x[(w, d)].varValue if self.x[(w, d)].varValue else 0
-                       for d in self.destinations)
+        for i, w in enumerate(self.warehouses):
+            used = row_sums[i]
             capacity = self.supply[w]
             util_pct = (used / capacity) * 100
             unused = capacity - used
@@ -219,7 +462,9 @@ class TransportationOptimizer:
             })
 
         df_util = pd.DataFrame(utilization)
-        print(df_util.to_string(index=False))
+        _w(df_util.to_string(index=False) + "\n")
+
+        sys.stdout.write(buf.getvalue())
 
         return df_allocation, df_cost, df_util
 
@@ -230,23 +475,51 @@ class TransportationOptimizer:
             print("Tidak ada solusi untuk divisualisasikan!")
             return
 
+        # Import plotting baru di sini supaya solve batch/CI tanpa
+        # visualisasi tidak membayar import matplotlib+seaborn dan scan
+        # font cache; tanpa DISPLAY pakai backend Agg agar tidak ada
+        # probing backend GUI
+        import matplotlib
+        if sys.platform.startswith('linux') and not os.environ.get('DISPLAY'):
+            matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         # Setup style
         plt.style.use('seaborn-v0_8-darkgrid')
         fig = plt.figure(figsize=(16, 10))
 
+        # Satu DataFrame tidy (gudang, tujuan, unit, biaya) dibangun sekali;
+        # keempat subplot diturunkan darinya lewat pivot/groupby ber-Cython,
+        # tanpa agregasi ulang per panel
+        n_w = len(self.warehouses)
+        n_d = len(self.destinations)
+        tidy = pd.DataFrame({
+            'w': np.repeat(self.warehouses, n_d),
+            'd': np.tile(self.destinations, n_w),
+            'units': self._extract_alloc().ravel(),
+            'cpu': self.cost_mat.ravel(),
+        })
+        tidy['total'] = tidy['units'] * tidy['cpu']
+        by_wh = tidy.groupby('w', sort=False)[['units', 'total']].sum()
+
         # 1. Heatmap Alokasi
         ax1 = plt.subplot(2, 2, 1)
-        allocation_data = np.zeros((len(self.warehouses), len(self.destinations)))
+        allocation_data = (tidy.pivot(index='w', columns='d', values='units')
+                           .reindex(index=self.warehouses,
+                                    columns=self.destinations)
+                           .to_numpy())
 
-        for i, w in enumerate(self.warehouses):
-            for j, d in enumerate(self.destinations):
-                value = self.x[(w, d)].varValue if self.x[(w, d)].varValue else 0
-                allocation_data[i, j] = value
+        # Label anotasi diformat sekali secara vectorized; sel bernilai 0
+        # dibiarkan kosong sehingga seaborn tinggal menempatkan teks jadi
+        annot_labels = np.where(allocation_data > 0,
+                                allocation_data.astype(str), '')
 
         sns.heatmap(allocation_data,
-                    annot=True,
-                    fmt='.0f',
+                    annot=annot_labels,
+                    fmt='',
                     cmap='YlOrRd',
+                    rasterized=True,
                     xticklabels=[d.replace('_', ' ') for d in self.destinations],
                     yticklabels=self.warehouses,
                     cbar_kws={'label': 'Unit'},
@@ -259,23 +532,13 @@ class TransportationOptimizer:
         # 2. Utilisasi Kapasitas Gudang
         ax2 = plt.subplot(2, 2, 2)
 
-        warehouses_list = []
-        used_list = []
-        unused_list = []
-
-        for w in self.warehouses:
-            used = sum(self.x[(w, d)].varValue if self.x[(w, d)].varValue else 0
-                       for d in self.destinations)
-            capacity = self.supply[w]
-            unused = capacity - used
-
-            warehouses_list.append(w)
-            used_list.append(used)
-            unused_list.append(unused)
+        warehouses_list = self.warehouses
+        used_arr = by_wh['units'].to_numpy()
+        unused_arr = self.supply_vec - used_arr
 
         x_pos = np.arange(len(warehouses_list))
-        ax2.bar(x_pos, used_list, label='Terpakai', color='#2ecc71', alpha=0.8)
-        ax2.bar(x_pos, unused_list, bottom=used_list, label='Sisa',
+        ax2.bar(x_pos, used_arr, label='Terpakai', color='#2ecc71', alpha=0.8)
+        ax2.bar(x_pos, unused_arr, bottom=used_arr, label='Sisa',
                 color='#e74c3c', alpha=0.8)
 
         ax2.set_xticks(x_pos)
@@ -286,26 +549,19 @@ class TransportationOptimizer:
         ax2.grid(axis='y', alpha=0.3)
 
         # Tambahkan persentase utilisasi
-        for i, (w, u, un) in enumerate(zip(warehouses_list, used_list, unused_list)):
-            total = u + un
-            pct = (u / total) * 100
-            ax2.text(i, total + 10, f'{pct:.1f}%',
+        util_pct = used_arr / self.supply_vec * 100
+        for i in range(len(warehouses_list)):
+            ax2.text(i, self.supply_vec[i] + 10, f'{util_pct[i]:.1f}%',
                      ha='center', va='bottom', fontsize=10, fontweight='bold')
 
         # 3. Distribusi Biaya per Gudang
         ax3 = plt.subplot(2, 2, 3)
 
-        cost_by_warehouse = {}
-        for w in self.warehouses:
-            cost = 0
-            for d in self.destinations:
-                quantity = self.x[(w, d)].varValue if self.x[(w, d)].varValue else 0
-                cost += self.costs[(w, d)] * quantity
-            cost_by_warehouse[w] = cost
+        cost_per_wh = by_wh['total'].to_numpy()
 
         colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12']
-        wedges, texts, autotexts = ax3.pie(cost_by_warehouse.values(),
-                                           labels=cost_by_warehouse.keys(),
+        wedges, texts, autotexts = ax3.pie(cost_per_wh,
+                                           labels=self.warehouses,
                                            autopct='%1.1f%%',
                                            colors=colors,
                                            startangle=90)
@@ -320,9 +576,9 @@ class TransportationOptimizer:
         # 4. Perbandingan Supply vs Demand
         ax4 = plt.subplot(2, 2, 4)
 
-        total_supply = sum(self.supply.values())
-        total_demand = sum(self.demand.values())
-        total_used = sum(used_list)
+        total_supply = int(self.supply_vec.sum())
+        total_demand = int(self.demand_vec.sum())
+        total_used = int(used_arr.sum())
 
         categories = ['Total Supply', 'Total Demand', 'Actual Used']
         values = [total_supply, total_demand, total_used]
@@ -338,13 +594,20 @@ class TransportationOptimizer:
         for bar, value in zip(bars, values):
             height = bar.get_height()
             ax4.text(bar.get_x() + bar.get_width()/2., height + 10,
-                     f'{int(value)}',
+                     f'{value}',
                      ha='center', va='bottom', fontsize=11, fontweight='bold')
 
         plt.tight_layout()
-        plt.savefig('transportation_optimization_results.png', dpi=300, bbox_inches='tight')
+        # dpi 150 cukup untuk layar; compress_level 1 menukar ukuran file
+        # dengan encoding PNG yang jauh lebih cepat
+        plt.savefig('transportation_optimization_results.png', dpi=150,
+                    bbox_inches='tight', pil_kwargs={'compress_level': 1})
         print("\n✓ Visualisasi disimpan sebagai 'transportation_optimization_results.png'")
-        plt.show()
+        # plt.show() memblokir di backend GUI dan tidak berguna di Agg;
+        # tutup figure agar state-nya langsung dibebaskan pada pemakaian batch
+        if not matplotlib.get_backend().lower().startswith('agg'):
+            plt.show()
+        plt.close(fig)
 
     def export_to_excel(self, filename='transportation_solution.xlsx'):
         """Export hasil ke Excel"""
@@ -353,17 +616,12 @@ class TransportationOptimizer:
             print("Tidak ada solusi untuk di-export!")
             return
 
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            # Sheet 1: Alokasi
-            allocation_matrix = []
-            for w in self.warehouses:
-                row = {'Gudang': w}
-                for d in self.destinations:
-                    value = self.x[(w, d)].varValue if self.x[(w, d)].varValue else 0
-                    row[d] = value
-                allocation_matrix.append(row)
+        alloc = self._extract_alloc()
 
-            df_allocation = pd.DataFrame(allocation_matrix)
+        with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
+            # Sheet 1: Alokasi (langsung dari matriks alokasi ter-cache)
+            df_allocation = pd.DataFrame(alloc, columns=self.destinations)
+            df_allocation.insert(0, 'Gudang', self.warehouses)
             df_allocation.to_excel(writer, sheet_name='Alokasi', index=False)
 
             # Sheet 2: Biaya Detail
@@ -389,14 +647,11 @@ class TransportationOptimizer:
                            'Supply Terpakai (unit)',
                            'Supply Tidak Terpakai (unit)'],
                 'Nilai': [
-                    pulp.value(self.model.objective),
-                    sum(self.supply.values()),
-                    sum(self.demand.values()),
-                    sum(self.x[(w, d)].varValue if self.x[(w, d)].varValue else 0
-                        for w in self.warehouses for d in self.destinations),
-                    sum(self.supply.values()) - sum(self.x[(w, d)].varValue
-                                                    if self.x[(w, d)].varValue else 0
-                                                    for w in self.warehouses for d in self.destinations)
+                    float((alloc * self.cost_mat).sum()),
+                    int(self.supply_vec.sum()),
+                    int(self.demand_vec.sum()),
+                    float(alloc.sum()),
+                    float(self.supply_vec.sum() - alloc.sum())
                 ]
             }
 
@@ -416,10 +671,7 @@ if __name__ == "__main__":
     # Inisialisasi optimizer
     optimizer = TransportationOptimizer()
 
-    # Bangun model
-    optimizer.build_model()
-
-    # Selesaikan
+    # Selesaikan (default: scipy linprog/HiGHS, tanpa subprocess CBC)
     if optimizer.solve():
         # Tampilkan hasil
         optimizer.display_results()
@@ -0,0 +1,215 @@
+"""
+Numba Transportation Kernel
+PT. MediCare Indonesia - Transportation Problem
+
+Compiled stepping-stone/MODI solver for parameter sweeps. The LP solvers
+in python_solver.py pay per-call setup (model build or matrix assembly),
+which dominates on a problem this small; this module solves the balanced
+transportation problem directly on dense arrays so thousands of scenario
+evaluations (cost perturbations, supply/demand variations) run per second.
+
+Numba is optional: when it is installed the kernels are JIT-compiled
+(and solve_batch parallelizes over scenarios), otherwise the same code
+runs as plain Python.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels run as plain Python"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+    prange = range
+
+
+@njit(cache=True)
+def solve_transport(cost, supply, demand):
+    """
+    Solve one balanced transportation problem with NW-corner + MODI
+
+    Args:
+        cost: (m, n) float64 cost matrix
+        supply: (m,) float64 supply vector
+        demand: (n,) float64 demand vector, sum(demand) == sum(supply)
+
+    Returns:
+        (alloc, obj): (m, n) float64 allocation matrix and objective value
+
+    The inner scans are written as explicit loops rather than NumPy
+    vectorization — that is what Numba compiles best, and at this size
+    the loop bodies stay in registers anyway.
+    """
+    m, n = cost.shape
+    alloc = np.zeros((m, n))
+    basic = np.zeros((m, n), dtype=np.bool_)
+
+    # Northwest-corner starting basis: always m + n - 1 basic cells
+    # (ties advance the row, leaving a zero-allocation basic cell)
+    s = supply.copy()
+    d = demand.copy()
+    i = 0
+    j = 0
+    while i < m and j < n:
+        q = s[i] if s[i] < d[j] else d[j]
+        alloc[i, j] = q
+        basic[i, j] = True
+        s[i] -= q
+        d[j] -= q
+        if s[i] == 0.0 and i < m - 1:
+            i += 1
+        else:
+            j += 1
+
+    u = np.zeros(m)
+    v = np.zeros(n)
+    u_set = np.zeros(m, dtype=np.bool_)
+    v_set = np.zeros(n, dtype=np.bool_)
+    path_i = np.empty(2 * (m + n), dtype=np.int64)
+    path_j = np.empty(2 * (m + n), dtype=np.int64)
+
+    for _ in range(200):
+        # Duals from the basic cells (u_0 = 0, propagate over the tree)
+        u_set[:] = False
+        v_set[:] = False
+        u[0] = 0.0
+        u_set[0] = True
+        changed = True
+        while changed:
+            changed = False
+            for a in range(m):
+                for b in range(n):
+                    if basic[a, b]:
+                        if u_set[a] and not v_set[b]:
+                            v[b] = cost[a, b] - u[a]
+                            v_set[b] = True
+                            changed = True
+                        elif v_set[b] and not u_set[a]:
+                            u[a] = cost[a, b] - v[b]
+                            u_set[a] = True
+                            changed = True
+
+        # Entering cell: most negative reduced cost
+        best = -1e-9
+        ei = -1
+        ej = -1
+        for a in range(m):
+            for b in range(n):
+                if not basic[a, b]:
+                    delta = cost[a, b] - u[a] - v[b]
+                    if delta < best:
+                        best = delta
+                        ei = a
+                        ej = b
+        if ei < 0:
+            break  # optimal
+
+        # Unique cycle through the entering cell: repeatedly cross out
+        # cells that are alone in their row or column
+        inloop = basic.copy()
+        inloop[ei, ej] = True
+        removed = True
+        while removed:
+            removed = False
+            for a in range(m):
+                cnt = 0
+                for b in range(n):
+                    if inloop[a, b]:
+                        cnt += 1
+                if cnt == 1:
+                    for b in range(n):
+                        if inloop[a, b] and not (a == ei and b == ej):
+                            inloop[a, b] = False
+                            removed = True
+            for b in range(n):
+                cnt = 0
+                for a in range(m):
+                    if inloop[a, b]:
+                        cnt += 1
+                if cnt == 1:
+                    for a in range(m):
+                        if inloop[a, b] and not (a == ei and b == ej):
+                            inloop[a, b] = False
+                            removed = True
+
+        # Walk the cycle from the entering cell, alternating row/column
+        # moves (each remaining row/column holds exactly two cells)
+        ci = ei
+        cj = ej
+        path_len = 0
+        move_row = True
+        while True:
+            path_i[path_len] = ci
+            path_j[path_len] = cj
+            path_len += 1
+            if move_row:
+                for b in range(n):
+                    if b != cj and inloop[ci, b]:
+                        cj = b
+                        break
+            else:
+                for a in range(m):
+                    if a != ci and inloop[a, cj]:
+                        ci = a
+                        break
+            move_row = not move_row
+            if ci == ei and cj == ej:
+                break
+
+        # Pivot: shift theta around the cycle, drop the leaving cell
+        theta = 1e18
+        li = -1
+        lj = -1
+        for k in range(1, path_len, 2):
+            if alloc[path_i[k], path_j[k]] < theta:
+                theta = alloc[path_i[k], path_j[k]]
+                li = path_i[k]
+                lj = path_j[k]
+        for k in range(path_len):
+            if k % 2 == 0:
+                alloc[path_i[k], path_j[k]] += theta
+            else:
+                alloc[path_i[k], path_j[k]] -= theta
+        basic[ei, ej] = True
+        basic[li, lj] = False
+
+    obj = 0.0
+    for a in range(m):
+        for b in range(n):
+            obj += cost[a, b] * alloc[a, b]
+    return alloc, obj
+
+
+@njit(parallel=True, cache=True)
+def solve_batch(costs_batch, supply, demand):
+    """
+    Solve a batch of scenarios that share supply/demand but vary costs
+
+    Args:
+        costs_batch: (k, m, n) float64 stack of cost matrices
+        supply: (m,) float64 supply vector
+        demand: (n,) float64 demand vector
+
+    Returns:
+        (allocs, objs): (k, m, n) allocations and (k,) objective values
+    """
+    k = costs_batch.shape[0]
+    m = costs_batch.shape[1]
+    n = costs_batch.shape[2]
+    allocs = np.zeros((k, m, n))
+    objs = np.zeros(k)
+    for t in prange(k):
+        a, o = solve_transport(costs_batch[t], supply, demand)
+        allocs[t] = a
+        objs[t] = o
+    return allocs, objs